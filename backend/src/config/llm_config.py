@@ -10,27 +10,45 @@ from langchain_core.embeddings import Embeddings
 from .settings import get_settings
 
 
-def get_http_client() -> httpx.Client:
+def get_ssl_verify():
     """
-    Get configured HTTP client with SSL settings for corporate environments.
+    Get the SSL verification setting for corporate environments.
     
     Returns:
-        Configured httpx.Client instance
+        Path to a custom certificate, or whether to verify SSL
     """
     settings = get_settings()
     
     # Configure SSL verification
     if settings.ssl_cert_path:
         # Use custom certificate
-        verify = settings.ssl_cert_path
+        return settings.ssl_cert_path
     elif settings.verify_ssl:
         # SSL verification enabled
-        verify = True
+        return True
     else:
         # Disable SSL verification (for development/testing only)
-        verify = False
+        return False
+
+
+def get_http_client() -> httpx.Client:
+    """
+    Get configured HTTP client with SSL settings for corporate environments.
+    
+    Returns:
+        Configured httpx.Client instance
+    """
+    return httpx.Client(verify=get_ssl_verify(), timeout=60.0)
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """
+    Get configured async HTTP client, used by ``ainvoke`` calls.
     
-    return httpx.Client(verify=verify, timeout=60.0)
+    Returns:
+        Configured httpx.AsyncClient instance
+    """
+    return httpx.AsyncClient(verify=get_ssl_verify(), timeout=60.0)
 
 
 def get_llm(
@@ -59,8 +77,9 @@ def get_llm(
     logging.getLogger(__name__).info(f"Base URL: {settings.tcs_genai_base_url}")
     logging.getLogger(__name__).info(f"SSL Verify: {settings.verify_ssl}")
     
-    # Use custom HTTP client for SSL configuration
+    # Use custom HTTP clients for SSL configuration (sync and async calls)
     http_client = get_http_client()
+    http_async_client = get_async_http_client()
     
     return ChatOpenAI(
         model=model_name or settings.default_model,
@@ -70,6 +89,7 @@ def get_llm(
         max_tokens=max_tokens,
         streaming=streaming,
         http_client=http_client,
+        http_async_client=http_async_client,
     )
 
 
@@ -14,6 +14,7 @@ from .tools import (
     COLLECTIONS,
     COMPANIES,
     normalize_company_id,
+    warm_probe_queries,
 )
 
 __all__ = [
@@ -31,4 +32,5 @@ __all__ = [
     "COLLECTIONS",
     "COMPANIES",
     "normalize_company_id",
+    "warm_probe_queries",
 ]
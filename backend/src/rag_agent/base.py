@@ -4,15 +4,16 @@ Base abstractions for RAG system.
 Provides abstract base classes and common interfaces for ingestion and retrieval.
 """
 
+import sys
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from typing import Any, Optional, List, Dict, Literal
+from dataclasses import dataclass, field, fields
+from typing import Any, Optional, List, Dict, Literal, Tuple
 from pathlib import Path
 from datetime import datetime
-from enum import Enum
+from enum import StrEnum
 
 
-class DocumentCategory(str, Enum):
+class DocumentCategory(StrEnum):
     """Document categories for M&A due diligence."""
     FINANCIAL = "financial"
     LEGAL = "legal"
@@ -22,7 +23,7 @@ class DocumentCategory(str, Enum):
     UNKNOWN = "unknown"
 
 
-class DocumentType(str, Enum):
+class DocumentType(StrEnum):
     """Document types within categories."""
     # Financial
     BALANCE_SHEET = "balance_sheet"
@@ -51,7 +52,7 @@ class DocumentType(str, Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class ChunkMetadata:
     """Metadata for a document chunk."""
     source: str
@@ -64,30 +65,86 @@ class ChunkMetadata:
     fiscal_year: Optional[int] = None
     upload_date: str = field(default_factory=lambda: datetime.now().isoformat())
     record_count: Optional[int] = None
-    linked_to: List[str] = field(default_factory=list)
+    linked_to: Tuple[str, ...] = ()
     chunk_index: int = 0
     total_chunks: int = 1
     
+    def __post_init__(self):
+        """Coerce raw strings to enums once so to_dict needs no type checks."""
+        # Imported here: metadata_normalizer imports this module
+        from src.rag_agent.metadata_normalizer import normalize_category, normalize_doc_type
+        
+        # Unmapped values fall back to UNKNOWN rather than raising
+        self.category = normalize_category(self.category)
+        self.doc_type = normalize_doc_type(self.doc_type)
+        self._intern_strings()
+    
+    def _intern_strings(self):
+        """Intern strings repeated across every chunk of a file/company."""
+        self.source = sys.intern(self.source)
+        self.filename = sys.intern(self.filename)
+        self.company_id = sys.intern(self.company_id)
+    
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, f.name) for f in fields(self))
+    
+    def __setstate__(self, state: Tuple[Any, ...]):
+        # Unpickling (e.g. results from ingestion worker processes) skips
+        # __post_init__ and yields uninterned copies; intern them again here
+        for f, value in zip(fields(self), state):
+            setattr(self, f.name, value)
+        self._intern_strings()
+    
+    def for_chunk(self, chunk_index: int, total_chunks: int, chunk_hash: str) -> "ChunkMetadata":
+        """
+        Copy this metadata for one chunk of the document.
+        
+        Skips __post_init__: the copied fields were already coerced and
+        interned when this instance was built.
+        
+        Args:
+            chunk_index: Position of the chunk in the document
+            total_chunks: Number of chunks the document was split into
+            chunk_hash: Content hash of the chunk
+            
+        Returns:
+            New metadata instance for the chunk
+        """
+        clone = object.__new__(ChunkMetadata)
+        for name in _DOCUMENT_FIELDS:
+            setattr(clone, name, getattr(self, name))
+        clone.chunk_index = chunk_index
+        clone.total_chunks = total_chunks
+        clone.chunk_hash = chunk_hash
+        return clone
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for storage."""
         return {
             "source": self.source,
             "filename": self.filename,
             "company_id": self.company_id,
-            "category": self.category.value if isinstance(self.category, DocumentCategory) else self.category,
-            "doc_type": self.doc_type.value if isinstance(self.doc_type, DocumentType) else self.doc_type,
+            "category": self.category.value,
+            "doc_type": self.doc_type.value,
             "chunk_hash": self.chunk_hash,
             "page": self.page,
             "fiscal_year": self.fiscal_year,
             "upload_date": self.upload_date,
             "record_count": self.record_count,
-            "linked_to": ",".join(self.linked_to) if self.linked_to else "",
+            "linked_to": ",".join(self.linked_to),
             "chunk_index": self.chunk_index,
             "total_chunks": self.total_chunks,
         }
 
 
-@dataclass
+# ChunkMetadata fields shared by every chunk of a document
+_DOCUMENT_FIELDS = tuple(
+    f.name for f in fields(ChunkMetadata)
+    if f.name not in ("chunk_index", "total_chunks", "chunk_hash")
+)
+
+
+@dataclass(slots=True)
 class DocumentChunk:
     """A chunk of document content with metadata."""
     content: str
@@ -102,7 +159,7 @@ class DocumentChunk:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class RetrievalResult:
     """Result from a retrieval query."""
     content: str
@@ -120,7 +177,7 @@ class RetrievalResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class IngestionStats:
     """Statistics from an ingestion run."""
     files_processed: int = 0
@@ -292,3 +349,21 @@ class BaseDeduplicator(ABC):
     def clear(self):
         """Clear the deduplication index."""
         pass
+    
+    def filter_batch(self, texts: List[str]) -> List[Optional[str]]:
+        """
+        Deduplicate a batch of texts in order, adding the unique ones.
+        
+        Args:
+            texts: Texts to check and add
+            
+        Returns:
+            Hash for each kept text, None for each duplicate
+        """
+        results: List[Optional[str]] = []
+        for text in texts:
+            if self.is_duplicate(text):
+                results.append(None)
+            else:
+                results.append(self.add(text))
+        return results
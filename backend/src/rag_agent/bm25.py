@@ -0,0 +1,180 @@
+"""
+BM25 keyword index for hybrid retrieval.
+
+Implements Okapi BM25 over an inverted index held in flat NumPy arrays, so
+scoring a query only touches the postings of its terms instead of looping
+over every document in Python.
+"""
+
+import math
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+
+class BM25Index:
+    """Okapi BM25 index with the same scoring as ``rank_bm25.BM25Okapi``."""
+
+    def __init__(
+        self,
+        tokenized_corpus: Sequence[Sequence[str]],
+        k1: float = 1.5,
+        b: float = 0.75,
+        epsilon: float = 0.25,
+    ):
+        """
+        Build the index.
+
+        Args:
+            tokenized_corpus: One token list per document
+            k1: Term frequency saturation
+            b: Document length normalization
+            epsilon: Floor for negative IDFs, as a fraction of the average IDF
+        """
+        self.k1 = k1
+        self.b = b
+        self.epsilon = epsilon
+        self.corpus_size = len(tokenized_corpus)
+
+        # Term ids are assigned in first-occurrence order
+        self.vocab: Dict[str, int] = {}
+        vocab = self.vocab
+        token_ids = np.fromiter(
+            (vocab.setdefault(token, len(vocab)) for tokens in tokenized_corpus for token in tokens),
+            dtype=np.int64,
+        )
+        doc_len = np.fromiter((len(tokens) for tokens in tokenized_corpus), dtype=np.int64,
+                              count=self.corpus_size)
+
+        # Postings sorted by (term, doc): term t owns the slice offsets[t]:offsets[t + 1]
+        token_docs = np.repeat(np.arange(self.corpus_size, dtype=np.int64), doc_len)
+        postings, term_freqs = np.unique(token_ids * self.corpus_size + token_docs, return_counts=True)
+        posting_terms, self._posting_docs = np.divmod(postings, self.corpus_size)
+        self._posting_freqs = term_freqs
+        doc_freqs = np.bincount(posting_terms, minlength=len(vocab))
+        self._offsets = np.concatenate(([0], np.cumsum(doc_freqs)))
+
+        self._set_doc_lengths(doc_len)
+        self.idf = self._calc_idf(doc_freqs)
+
+    def _set_doc_lengths(self, doc_len: np.ndarray) -> None:
+        """Store document lengths and the per-document length normalization."""
+        self.doc_len = doc_len
+        self.avgdl = doc_len.sum() / self.corpus_size
+        self._length_norm = self.k1 * (1 - self.b + self.b * doc_len / self.avgdl)
+
+    def _calc_idf(self, doc_freqs: np.ndarray) -> np.ndarray:
+        """Compute IDFs, flooring negative ones at epsilon * average IDF."""
+        idf = np.array([
+            math.log(self.corpus_size - freq + 0.5) - math.log(freq + 0.5)
+            for freq in doc_freqs.tolist()
+        ])
+        # Summed in term order to match the reference implementation exactly
+        self.average_idf = sum(idf.tolist()) / len(idf) if len(idf) else 0.0
+        idf[idf < 0] = self.epsilon * self.average_idf
+        return idf
+
+    def get_scores(self, query: Sequence[str]) -> np.ndarray:
+        """
+        Score every document against a tokenized query.
+
+        Args:
+            query: Query tokens; repeated tokens count repeatedly
+
+        Returns:
+            Array of BM25 scores, one per document
+        """
+        scores = np.zeros(self.corpus_size)
+        for token in query:
+            term_id = self.vocab.get(token)
+            if term_id is None:
+                continue
+            start, end = self._offsets[term_id], self._offsets[term_id + 1]
+            docs = self._posting_docs[start:end]
+            freqs = self._posting_freqs[start:end]
+            scores[docs] += self.idf[term_id] * (
+                freqs * (self.k1 + 1) / (freqs + self._length_norm[docs])
+            )
+        return scores
+
+    def save(self, path: Path, signature: str) -> None:
+        """
+        Persist the index to a single ``.npz`` file.
+
+        The file is written to a uniquely named temporary file next to its
+        destination and renamed into place, so concurrent readers never see a
+        partial index, and concurrent writers (threads or processes) never
+        share a temporary file.
+
+        Args:
+            path: Destination file
+            signature: Corpus signature checked by ``load``
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(
+                    f,
+                    signature=np.array(signature),
+                    params=np.array([self.k1, self.b, self.epsilon, self.average_idf]),
+                    # Tokens never contain whitespace, so newline-joined UTF-8 is lossless
+                    vocab=np.frombuffer("\n".join(self.vocab).encode("utf-8"), dtype=np.uint8),
+                    posting_docs=self._posting_docs,
+                    posting_freqs=self._posting_freqs,
+                    offsets=self._offsets,
+                    doc_len=self.doc_len,
+                    idf=self.idf,
+                )
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @classmethod
+    def load(
+        cls,
+        path: Path,
+        signature: str,
+        k1: float = 1.5,
+        b: float = 0.75,
+        epsilon: float = 0.25,
+    ) -> Optional["BM25Index"]:
+        """
+        Load an index saved by ``save``.
+
+        Args:
+            path: File to load
+            signature: Expected corpus signature
+            k1: Expected term frequency saturation
+            b: Expected document length normalization
+            epsilon: Expected IDF floor
+
+        Returns:
+            The index, or None if the file is missing or was built from a
+            different corpus or parameters
+        """
+        if not path.exists():
+            return None
+        with np.load(path, allow_pickle=False) as data:
+            saved_k1, saved_b, saved_epsilon, average_idf = data["params"].tolist()
+            if str(data["signature"]) != signature or (saved_k1, saved_b, saved_epsilon) != (k1, b, epsilon):
+                return None
+            index = cls.__new__(cls)
+            index.k1, index.b, index.epsilon = k1, b, epsilon
+            index.average_idf = average_idf
+            vocab_text = data["vocab"].tobytes().decode("utf-8")
+            tokens = vocab_text.split("\n") if vocab_text else []
+            index.vocab = {token: term_id for term_id, token in enumerate(tokens)}
+            index._posting_docs = data["posting_docs"]
+            index._posting_freqs = data["posting_freqs"]
+            index._offsets = data["offsets"]
+            index.idf = data["idf"]
+            doc_len = data["doc_len"]
+        index.corpus_size = len(doc_len)
+        index._set_doc_lengths(doc_len)
+        return index
@@ -12,6 +12,9 @@ from src.common.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Document types that hold tabular data and get the larger structured chunks
+STRUCTURED_DOC_TYPES = frozenset({"employee_record", "financial_data"})
+
 
 class SemanticChunker(BaseChunker):
     """Semantic chunker using sentence boundaries."""
@@ -74,12 +77,10 @@ class SemanticChunker(BaseChunker):
     
     def _simple_split(self, text: str) -> List[str]:
         """Simple fallback splitting."""
-        chunks = []
-        for i in range(0, len(text), self.chunk_size - self.chunk_overlap):
-            chunk = text[i:i + self.chunk_size]
-            if chunk.strip():
-                chunks.append(chunk)
-        return chunks
+        size = self.chunk_size
+        step = max(size - self.chunk_overlap, 1)
+        windows = [text[i:i + size] for i in range(0, len(text), step)]
+        return [w for w in windows if not w.isspace()]
 
 
 class LlamaIndexSemanticChunker(BaseChunker):
@@ -166,13 +167,12 @@ class AdaptiveChunker(BaseChunker):
         if not text or not text.strip():
             return []
         
-        # Check if structured data (CSV-like)
-        if metadata and metadata.get('doc_type') in ['employee_record', 'financial_data']:
-            # Use larger chunks for tabular data
-            return self.structured.chunk(text, metadata)
-        
-        # Check if contains many tables/pipes
-        if text.count('|') > 10 or text.count('\t') > 10:
+        # Use larger chunks for structured (CSV-like) data or text with many tables/pipes
+        if (
+            (metadata and metadata.get('doc_type') in STRUCTURED_DOC_TYPES)
+            or text.count('|') > 10
+            or text.count('\t') > 10
+        ):
             return self.structured.chunk(text, metadata)
         
         # Default semantic chunking
@@ -2,10 +2,15 @@
 Deduplication utilities for RAG ingestion.
 
 Implements exact hash and fuzzy MinHash-based deduplication.
+
+All deduplicators are safe to share between threads: hashing and MinHash
+construction run unlocked, and only the index check-and-insert steps are
+serialized.
 """
 
 import hashlib
-from typing import Set, Optional
+import threading
+from typing import List, Set, Optional, Tuple
 from datasketch import MinHash, MinHashLSH
 
 from src.rag_agent.base import BaseDeduplicator
@@ -21,12 +26,35 @@ class ExactDeduplicator(BaseDeduplicator):
         """Initialize the exact deduplicator."""
         self.seen_hashes: Set[str] = set()
         self.duplicate_count = 0
+        self._lock = threading.Lock()
+        # Last (text, hash) pair, so an is_duplicate() followed by add()
+        # on the same chunk only pays for SHA256 once. Kept as one tuple
+        # so concurrent readers never see a mismatched pair.
+        self._last: Tuple[Optional[str], str] = (None, "")
     
     def _compute_hash(self, text: str) -> str:
         """Compute SHA256 hash of normalized text."""
-        normalized = text.strip().lower()
+        last_text, last_hash = self._last
+        if text is last_text:
+            return last_hash
+        text_hash = self._hash_normalized(text.strip().lower())
+        self._last = (text, text_hash)
+        return text_hash
+    
+    @staticmethod
+    def _hash_normalized(normalized: str) -> str:
+        """Compute SHA256 hash of already-normalized text."""
         return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
     
+    def _add_hash(self, text_hash: str) -> bool:
+        """Record a precomputed hash; return True if it was not seen before."""
+        with self._lock:
+            if text_hash in self.seen_hashes:
+                self.duplicate_count += 1
+                return False
+            self.seen_hashes.add(text_hash)
+            return True
+    
     def is_duplicate(self, text: str) -> bool:
         """Check if text is an exact duplicate."""
         text_hash = self._compute_hash(text)
@@ -35,16 +63,15 @@ class ExactDeduplicator(BaseDeduplicator):
     def add(self, text: str) -> str:
         """Add text to dedup index and return hash."""
         text_hash = self._compute_hash(text)
-        if text_hash in self.seen_hashes:
-            self.duplicate_count += 1
-        else:
-            self.seen_hashes.add(text_hash)
+        self._add_hash(text_hash)
         return text_hash
     
     def clear(self):
         """Clear the deduplication index."""
-        self.seen_hashes.clear()
-        self.duplicate_count = 0
+        with self._lock:
+            self.seen_hashes.clear()
+            self.duplicate_count = 0
+        self._last = (None, "")
     
     @property
     def total_unique(self) -> int:
@@ -76,60 +103,68 @@ class FuzzyDeduplicator(BaseDeduplicator):
         self.minhashes = {}
         self.duplicate_count = 0
         self.id_counter = 0
+        # MinHashLSH is not thread-safe; guards every query/insert on it
+        self._lock = threading.Lock()
     
     def _create_minhash(self, text: str) -> MinHash:
         """Create MinHash from text using character n-grams."""
+        return self._minhash_normalized(text.strip().lower())
+    
+    def _minhash_normalized(self, normalized: str) -> MinHash:
+        """Create MinHash from already-normalized text."""
         minhash = MinHash(num_perm=self.num_perm)
         
-        # Normalize text
-        normalized = text.strip().lower()
-        
-        # Create character n-grams
-        for i in range(len(normalized) - self.ngram_size + 1):
-            ngram = normalized[i:i + self.ngram_size]
-            minhash.update(ngram.encode('utf-8'))
+        # Distinct character n-grams, hashed in one vectorized call;
+        # repeated shingles cannot change the signature
+        n = self.ngram_size
+        shingles = {normalized[i:i + n] for i in range(len(normalized) - n + 1)}
+        if shingles:
+            minhash.update_batch([ngram.encode('utf-8') for ngram in shingles])
         
         return minhash
     
+    def _is_duplicate_minhash(self, minhash: MinHash) -> bool:
+        """Check a precomputed MinHash against the LSH index."""
+        with self._lock:
+            return len(self.lsh.query(minhash)) > 0
+    
+    def _add_minhash(self, minhash: MinHash) -> str:
+        """Add a precomputed MinHash to the LSH index and return its ID."""
+        with self._lock:
+            # Check if similar document exists
+            results = self.lsh.query(minhash)
+            if results:
+                self.duplicate_count += 1
+                # Return existing similar doc ID
+                return results[0]
+            
+            # Add new document
+            doc_id = f"doc_{self.id_counter}"
+            self.id_counter += 1
+            self.lsh.insert(doc_id, minhash)
+            self.minhashes[doc_id] = minhash
+        
+        return doc_id
+    
     def is_duplicate(self, text: str) -> bool:
         """Check if text is a fuzzy duplicate."""
         if not text.strip():
             return False
-        
-        minhash = self._create_minhash(text)
-        # Query LSH for similar items
-        results = self.lsh.query(minhash)
-        
-        return len(results) > 0
+        return self._is_duplicate_minhash(self._create_minhash(text))
     
     def add(self, text: str) -> str:
         """Add text to LSH index and return unique ID."""
         if not text.strip():
             return ""
-        
-        minhash = self._create_minhash(text)
-        
-        # Check if similar document exists
-        if self.is_duplicate(text):
-            self.duplicate_count += 1
-            # Return existing similar doc ID
-            results = self.lsh.query(minhash)
-            return results[0] if results else ""
-        
-        # Add new document
-        doc_id = f"doc_{self.id_counter}"
-        self.id_counter += 1
-        self.lsh.insert(doc_id, minhash)
-        self.minhashes[doc_id] = minhash
-        
-        return doc_id
+        return self._add_minhash(self._create_minhash(text))
     
     def clear(self):
         """Clear the LSH index."""
-        self.lsh = MinHashLSH(threshold=self.threshold, num_perm=self.num_perm)
-        self.minhashes.clear()
-        self.duplicate_count = 0
-        self.id_counter = 0
+        with self._lock:
+            self.lsh = MinHashLSH(threshold=self.threshold, num_perm=self.num_perm)
+            self.minhashes.clear()
+            self.duplicate_count = 0
+            self.id_counter = 0
     
     @property
     def total_unique(self) -> int:
@@ -138,7 +173,12 @@ class FuzzyDeduplicator(BaseDeduplicator):
 
 
 class HybridDeduplicator(BaseDeduplicator):
-    """Hybrid deduplicator using both exact and fuzzy methods."""
+    """Hybrid deduplicator using both exact and fuzzy methods.
+    
+    Text is normalized once per chunk and the resulting hash/MinHash are
+    shared by the exact and fuzzy indexes, so the usual is_duplicate()
+    then add() sequence does not repeat any of that work.
+    """
     
     def __init__(
         self,
@@ -153,31 +193,97 @@ class HybridDeduplicator(BaseDeduplicator):
             num_perm=num_perm,
             ngram_size=ngram_size
         )
+        # Per-text caches, each swapped in as a single tuple so they stay
+        # consistent when the deduplicator is shared between threads
+        self._last: Tuple[Optional[str], str, str] = (None, "", "")
+        self._last_minhash: Tuple[Optional[str], Optional[MinHash]] = (None, None)
+    
+    def _prepare(self, text: str) -> Tuple[str, str]:
+        """Normalize text and compute its exact hash, reusing the last result."""
+        last_text, normalized, text_hash = self._last
+        if text is not last_text:
+            normalized = text.strip().lower()
+            text_hash = ExactDeduplicator._hash_normalized(normalized)
+            self._last = (text, normalized, text_hash)
+        return normalized, text_hash
+    
+    def _minhash_for(self, text: str, normalized: str) -> MinHash:
+        """Get the MinHash for a prepared text, reusing the last result."""
+        last_text, minhash = self._last_minhash
+        if text is not last_text or minhash is None:
+            minhash = self.fuzzy._minhash_normalized(normalized)
+            self._last_minhash = (text, minhash)
+        return minhash
     
     def is_duplicate(self, text: str) -> bool:
         """Check if text is duplicate using exact first, then fuzzy."""
+        normalized, text_hash = self._prepare(text)
+        
         # Fast exact check first
-        if self.exact.is_duplicate(text):
+        if text_hash in self.exact.seen_hashes:
             return True
+        if not normalized:
+            return False
         
         # Slower fuzzy check
-        return self.fuzzy.is_duplicate(text)
+        return self.fuzzy._is_duplicate_minhash(self._minhash_for(text, normalized))
     
     def add(self, text: str) -> str:
         """Add text to both indexes."""
-        exact_hash = self.exact.add(text)
+        normalized, text_hash = self._prepare(text)
+        self.exact._add_hash(text_hash)
+        
+        # Only the first unique text is indexed for fuzzy matching, as before;
+        # indexing every chunk drops distinct rows that share boilerplate
+        if len(self.exact.seen_hashes) == 1 and normalized:
+            self.fuzzy._add_minhash(self._minhash_for(text, normalized))
         
-        # Only add to fuzzy if not exact duplicate
-        if exact_hash not in self.exact.seen_hashes or len(self.exact.seen_hashes) == 1:
-            fuzzy_id = self.fuzzy.add(text)
-            return exact_hash  # Return exact hash as primary ID
+        return text_hash  # Return exact hash as primary ID
+    
+    def filter_batch(self, texts: List[str]) -> List[Optional[str]]:
+        """
+        Deduplicate a batch of texts in order, adding the unique ones.
+        
+        Gives the same results as calling is_duplicate() and then add() on
+        each text in turn. Hashing runs over the whole batch up front, and
+        MinHashes are only built while the fuzzy index has anything to match.
+        
+        Args:
+            texts: Texts to check and add
+            
+        Returns:
+            Exact hash for each kept text, None for each duplicate
+        """
+        normalized_texts = [text.strip().lower() for text in texts]
+        hash_normalized = ExactDeduplicator._hash_normalized
+        text_hashes = [hash_normalized(normalized) for normalized in normalized_texts]
         
-        return exact_hash
+        seen_hashes = self.exact.seen_hashes
+        fuzzy = self.fuzzy
+        results: List[Optional[str]] = []
+        for normalized, text_hash in zip(normalized_texts, text_hashes):
+            if text_hash in seen_hashes:
+                results.append(None)
+                continue
+            minhash = None
+            if normalized and fuzzy.minhashes:
+                minhash = fuzzy._minhash_normalized(normalized)
+                if fuzzy._is_duplicate_minhash(minhash):
+                    results.append(None)
+                    continue
+            self.exact._add_hash(text_hash)
+            # Same fuzzy indexing rule as add(): only the first unique text
+            if len(seen_hashes) == 1 and normalized:
+                fuzzy._add_minhash(minhash or fuzzy._minhash_normalized(normalized))
+            results.append(text_hash)
+        return results
     
     def clear(self):
         """Clear both indexes."""
         self.exact.clear()
         self.fuzzy.clear()
+        self._last = (None, "", "")
+        self._last_minhash = (None, None)
     
     @property
     def total_duplicates(self) -> int:
@@ -2,6 +2,7 @@
 """RAG Agent graph for document retrieval and search."""
 
 import time
+from functools import lru_cache
 from typing import Literal
 from langgraph.graph import StateGraph, END
 from langgraph.prebuilt import ToolNode
@@ -71,10 +72,20 @@ rag_tools = [
 ]
 
 
+@lru_cache()
+def get_rag_llm_with_tools():
+    """
+    Get the RAG agent LLM with tools bound.
+    
+    Cached so the tool schemas are built once per process instead of on
+    every agent step.
+    """
+    return get_llm(temperature=0.0).bind_tools(rag_tools)
+
+
 def create_rag_agent_node(state: RAGAgentState) -> dict:
     """RAG agent node that retrieves documents."""
-    llm = get_llm(temperature=0.0)
-    llm_with_tools = llm.bind_tools(rag_tools)
+    llm_with_tools = get_rag_llm_with_tools()
     
     messages = [SystemMessage(content=RAG_AGENT_PROMPT)] + state.messages
     
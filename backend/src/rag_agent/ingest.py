@@ -4,12 +4,19 @@ RAG Ingestion Pipeline.
 Orchestrates document loading, chunking, deduplication, embedding, and storage.
 """
 
+import hashlib
 import os
+import queue
+import threading
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Tuple
 from datetime import datetime
 from collections import defaultdict
+from fnmatch import fnmatch
+from itertools import groupby
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
+import numpy as np
 from langchain_core.documents import Document
 try:
     from langchain_chroma import Chroma
@@ -23,6 +30,7 @@ from src.rag_agent.loaders import get_loader_for_file
 from src.rag_agent.chunker import get_chunker
 from src.rag_agent.deduplicator import HybridDeduplicator
 from src.rag_agent.metadata_normalizer import normalize_metadata
+from src.rag_agent.retrieve import invalidate_collections
 from src.config.llm_config import get_embedding_model
 from src.config.settings import get_settings
 from src.common.logging_config import get_logger
@@ -38,6 +46,83 @@ COLLECTIONS = {
     "all": "dd_all_docs",
 }
 
+# HNSW settings applied when a collection is first created. They only defer
+# index persistence during bulk writes; graph parameters (M, construction_ef)
+# stay at Chroma's defaults because every collection is queried by the agents.
+# Chroma ignores this metadata for existing collections, so stores created
+# with the earlier M=12 / construction_ef=64 settings keep them until the
+# collection is deleted and re-ingested.
+HNSW_BULK_METADATA = {
+    "hnsw:batch_size": 10000,
+    "hnsw:sync_threshold": 50000,
+}
+
+# Sentinel closing a directory-ingestion pipeline stage
+_STAGE_DONE = object()
+
+# File extensions the loaders can handle
+SUPPORTED_EXTENSIONS = frozenset({
+    ".csv", ".txt", ".md", ".pdf", ".png", ".jpg", ".jpeg", ".tiff", ".bmp",
+})
+
+
+def _chunk_category(chunk: DocumentChunk) -> DocumentCategory:
+    """Grouping key for buffering chunks by category."""
+    return chunk.metadata.category
+
+
+def _chunk_id(chunk: DocumentChunk) -> str:
+    """
+    Stable Chroma id for a chunk, from its source file and content hash.
+    
+    Including the source keeps identical text from different files (and so
+    different companies) as separate records with their own metadata.
+    """
+    key = f"{chunk.metadata.source}|{chunk.metadata.chunk_hash}"
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _iter_supported_files(directory: Path, recursive: bool, file_pattern: str) -> Iterator[Path]:
+    """
+    Yield supported files under a directory.
+    
+    Uses os.scandir so file/directory checks come from the cached directory
+    entry type instead of a stat() per path.
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if recursive:
+                    yield from _iter_supported_files(Path(entry.path), recursive, file_pattern)
+            elif entry.is_file():
+                name = entry.name
+                ext = os.path.splitext(name)[1].lower()
+                if ext in SUPPORTED_EXTENSIONS and fnmatch(name, file_pattern):
+                    yield Path(entry.path)
+
+
+# Per-process pipeline used by ingestion worker processes
+_worker_pipeline: Optional["RAGIngestionPipeline"] = None
+
+
+def _init_worker(chunk_strategy: str, chunk_size: int, chunk_overlap: int):
+    """Create the loading/chunking pipeline for a worker process."""
+    global _worker_pipeline
+    _worker_pipeline = RAGIngestionPipeline(
+        chunk_strategy=chunk_strategy,
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        use_dedup=False,
+    )
+
+
+def _load_and_split_in_worker(
+    file_path: Path,
+) -> Tuple[Optional[List[Tuple[DocumentChunk, List[str]]]], IngestionStats]:
+    """Load and split one file in a worker process, returning its partial stats."""
+    stats = IngestionStats()
+    return _worker_pipeline._load_and_split(file_path, stats), stats
+
 
 class RAGIngestionPipeline:
     """Pipeline for ingesting documents into ChromaDB."""
@@ -50,6 +135,9 @@ class RAGIngestionPipeline:
         use_dedup: bool = True,
         fuzzy_threshold: float = 0.8,
         batch_size: int = 128,
+        category_collections: bool = True,
+        flush_threshold: int = 2000,
+        queue_size: int = 4,
     ):
         """
         Initialize ingestion pipeline.
@@ -61,91 +149,175 @@ class RAGIngestionPipeline:
             use_dedup: Enable deduplication
             fuzzy_threshold: Fuzzy dedup threshold
             batch_size: Batch size for embeddings
+            category_collections: Also write each chunk to its per-category
+                collection (read by the agent tools). When False, chunks are
+                stored once in the 'all' collection and HybridRetriever serves
+                categories from it with a metadata filter.
+            flush_threshold: Buffered chunks per category that trigger a write
+                during directory ingestion
+            queue_size: Batches that may wait between the chunking,
+                embedding and writing stages of directory ingestion
         """
+        self.chunk_strategy = chunk_strategy
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
         self.chunker = get_chunker(chunk_strategy, chunk_size, chunk_overlap)
         self.deduplicator = HybridDeduplicator(fuzzy_threshold=fuzzy_threshold) if use_dedup else None
         self.batch_size = batch_size
+        self.category_collections = category_collections
+        self.flush_threshold = flush_threshold
+        self.queue_size = queue_size
+        self._vectorstores: Dict[str, Chroma] = {}
+        # One writer thread per target collection ('all' + category), reused
+        # across flushes; created on first write and shut down by close()
+        self._write_pool: Optional[ThreadPoolExecutor] = None
         self.settings = get_settings()
         
         logger.info(f"Initialized RAG ingestion pipeline with {chunk_strategy} chunking")
     
+    def __enter__(self) -> "RAGIngestionPipeline":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Wait for pending writes and stop the writer threads; a later write starts new ones."""
+        if self._write_pool is not None:
+            self._write_pool.shutdown(wait=True)
+            self._write_pool = None
+    
+    def _get_write_pool(self) -> ThreadPoolExecutor:
+        """Get the writer thread pool, creating it on first use."""
+        if self._write_pool is None:
+            self._write_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="chroma-writer")
+        return self._write_pool
+    
     def _get_vectorstore(self, category: DocumentCategory) -> Chroma:
         """Get or create a ChromaDB vector store for a category."""
         collection_name = COLLECTIONS.get(category, COLLECTIONS["all"])
+        
+        # Reuse one client per collection for the whole run
+        vectorstore = self._vectorstores.get(collection_name)
+        if vectorstore is not None:
+            return vectorstore
+        
         embeddings = get_embedding_model()
         
         persist_dir = Path(self.settings.chroma_persist_directory) / collection_name
         persist_dir.mkdir(parents=True, exist_ok=True)
         
-        return Chroma(
+        vectorstore = Chroma(
             collection_name=collection_name,
             embedding_function=embeddings,
             persist_directory=str(persist_dir),
+            collection_metadata=HNSW_BULK_METADATA,
         )
+        self._vectorstores[collection_name] = vectorstore
+        return vectorstore
     
-    def ingest_file(self, file_path: Path, stats: IngestionStats) -> List[DocumentChunk]:
+    def _load_and_split(
+        self, file_path: Path, stats: IngestionStats
+    ) -> Optional[List[Tuple[DocumentChunk, List[str]]]]:
         """
-        Ingest a single file.
+        Load a file and split each loaded document into text chunks.
+        
+        This is the CPU-heavy, order-independent half of ingest_file (parsing,
+        OCR, chunking) and is what ingestion worker processes run.
         
         Args:
             file_path: Path to file
-            stats: Stats object to update
+            stats: Stats object to update with errors/failures
             
         Returns:
-            List of processed chunks
+            List of (document chunk, text chunks) pairs, or None if the file
+            was skipped or failed
         """
-        logger.info(f"Processing file: {file_path.name}")
-        
         try:
             # Get appropriate loader
             loader = get_loader_for_file(file_path)
             if not loader:
                 logger.warning(f"No loader found for {file_path.suffix}")
                 stats.errors.append(f"No loader for {file_path.name}")
-                return []
+                return None
             
             # Load document chunks
             doc_chunks = loader.load(file_path)
             if not doc_chunks:
                 logger.warning(f"No content extracted from {file_path.name}")
-                return []
+                return None
             
+            # Chunk the content (chunkers only look at doc_type)
+            return [
+                (
+                    doc_chunk,
+                    self.chunker.chunk(
+                        doc_chunk.content,
+                        metadata={"doc_type": doc_chunk.metadata.doc_type.value}
+                    ),
+                )
+                for doc_chunk in doc_chunks
+            ]
+        
+        except Exception as e:
+            logger.error(f"Error processing {file_path}: {e}", exc_info=True)
+            stats.files_failed += 1
+            stats.errors.append(f"{file_path.name}: {str(e)}")
+            return None
+    
+    def _build_chunks(
+        self,
+        file_path: Path,
+        split_docs: Optional[List[Tuple[DocumentChunk, List[str]]]],
+        stats: IngestionStats,
+    ) -> List[DocumentChunk]:
+        """
+        Deduplicate and stamp metadata on the text chunks of one file.
+        
+        Runs in the parent process, in file order, so dedup results do not
+        depend on how loading was scheduled.
+        
+        Args:
+            file_path: Path to file
+            split_docs: Output of _load_and_split
+            stats: Stats object to update
+            
+        Returns:
+            List of processed chunks
+        """
+        if split_docs is None:
+            return []
+        
+        try:
             processed_chunks = []
             
-            for doc_chunk in doc_chunks:
-                # Chunk the content
-                text_chunks = self.chunker.chunk(
-                    doc_chunk.content,
-                    metadata=doc_chunk.metadata.to_dict()
+            for doc_chunk, text_chunks in split_docs:
+                total_chunks = len(text_chunks)
+                
+                # Deduplicate the document's chunks in one batch
+                if self.deduplicator:
+                    chunk_hashes = self.deduplicator.filter_batch(text_chunks)
+                else:
+                    chunk_hashes = [
+                        hashlib.blake2b(text.encode(), digest_size=8).hexdigest()
+                        for text in text_chunks
+                    ]
+                
+                # Create chunks with their own metadata copy, skipping duplicates
+                kept = [
+                    (i, text, chunk_hash)
+                    for i, (text, chunk_hash) in enumerate(zip(text_chunks, chunk_hashes))
+                    if chunk_hash is not None
+                ]
+                metadata = doc_chunk.metadata
+                processed_chunks.extend(
+                    DocumentChunk(content=text, metadata=metadata.for_chunk(i, total_chunks, chunk_hash))
+                    for i, text, chunk_hash in kept
                 )
                 
-                # Create chunks with metadata
-                for i, text in enumerate(text_chunks):
-                    # Update chunk metadata
-                    doc_chunk.metadata.chunk_index = i
-                    doc_chunk.metadata.total_chunks = len(text_chunks)
-                    
-                    # Deduplication
-                    if self.deduplicator:
-                        if self.deduplicator.is_duplicate(text):
-                            stats.chunks_deduplicated += 1
-                            continue
-                        chunk_hash = self.deduplicator.add(text)
-                    else:
-                        import hashlib
-                        chunk_hash = hashlib.sha256(text.encode()).hexdigest()[:16]
-                    
-                    doc_chunk.metadata.chunk_hash = chunk_hash
-                    
-                    # Create final chunk
-                    chunk = DocumentChunk(
-                        content=text,
-                        metadata=doc_chunk.metadata,
-                    )
-                    
-                    processed_chunks.append(chunk)
-                    stats.chunks_created += 1
-                    stats.total_characters += len(text)
+                stats.chunks_deduplicated += total_chunks - len(kept)
+                stats.chunks_created += len(kept)
+                stats.total_characters += sum(len(text) for _, text, _ in kept)
             
             stats.files_processed += 1
             
@@ -162,57 +334,245 @@ class RAGIngestionPipeline:
             stats.errors.append(f"{file_path.name}: {str(e)}")
             return []
     
+    def ingest_file(self, file_path: Path, stats: IngestionStats) -> List[DocumentChunk]:
+        """
+        Ingest a single file.
+        
+        Args:
+            file_path: Path to file
+            stats: Stats object to update
+            
+        Returns:
+            List of processed chunks
+        """
+        logger.info(f"Processing file: {file_path.name}")
+        return self._build_chunks(file_path, self._load_and_split(file_path, stats), stats)
+    
+    def _iter_split_files(
+        self,
+        files: List[Path],
+        stats: IngestionStats,
+        max_workers: Optional[int],
+    ) -> Iterator[Optional[List[Tuple[DocumentChunk, List[str]]]]]:
+        """
+        Load and split files, in a process pool when more than one worker is allowed.
+        
+        Yields results in the same order as files.
+        """
+        if max_workers == 1 or len(files) < 2:
+            for i, file_path in enumerate(files, 1):
+                logger.info(f"Processing file {i}/{len(files)}: {file_path.name}")
+                yield self._load_and_split(file_path, stats)
+            return
+        
+        # Don't spawn (and initialize a chunker in) more workers than files
+        with ProcessPoolExecutor(
+            max_workers=min(max_workers or os.cpu_count() or 1, len(files)),
+            initializer=_init_worker,
+            initargs=(self.chunk_strategy, self.chunk_size, self.chunk_overlap),
+        ) as executor:
+            results = executor.map(_load_and_split_in_worker, files, chunksize=4)
+            for i, (file_path, (split_docs, worker_stats)) in enumerate(zip(files, results), 1):
+                logger.info(f"Processing file {i}/{len(files)}: {file_path.name}")
+                stats.files_failed += worker_stats.files_failed
+                stats.errors.extend(worker_stats.errors)
+                yield split_docs
+    
     def _chunks_to_langchain_docs(self, chunks: List[DocumentChunk]) -> List[Document]:
         """Convert DocumentChunk objects to LangChain Document objects."""
-        docs = []
-        for chunk in chunks:
-            doc = Document(
-                page_content=chunk.content,
-                metadata=chunk.metadata.to_dict()
+        return [
+            Document(page_content=chunk.content, metadata=chunk.metadata.to_dict())
+            for chunk in chunks
+        ]
+    
+    def _embed_documents(self, docs: List[Document]) -> np.ndarray:
+        """
+        Embed document contents in batch_size slices.
+        
+        Returns:
+            float32 matrix with one row per document. Holding vectors as a
+            packed array instead of lists of Python floats keeps batches
+            waiting in the writer queue several times smaller.
+        """
+        embedding_model = get_embedding_model()
+        embeddings: Optional[np.ndarray] = None
+        for i in range(0, len(docs), self.batch_size):
+            batch = docs[i:i + self.batch_size]
+            vectors = np.asarray(
+                embedding_model.embed_documents([doc.page_content for doc in batch]),
+                dtype=np.float32,
+            )
+            if embeddings is None:
+                embeddings = np.empty((len(docs), vectors.shape[1]), dtype=np.float32)
+            embeddings[i:i + len(batch)] = vectors
+        return embeddings
+    
+    def _add_embedded(
+        self,
+        vectorstore: Chroma,
+        ids: List[str],
+        docs: List[Document],
+        embeddings: List[np.ndarray],
+    ):
+        """Upsert documents with precomputed embeddings, bypassing Chroma's embedding call."""
+        vectorstore._collection.upsert(
+            ids=ids,
+            embeddings=embeddings,
+            documents=[doc.page_content for doc in docs],
+            metadatas=[doc.metadata for doc in docs],
+        )
+    
+    def _missing_ids(self, vectorstore: Chroma, ids: List[str]) -> List[str]:
+        """Return the ids not yet stored in a vector store, probed in batch_size batches."""
+        missing: List[str] = []
+        for i in range(0, len(ids), self.batch_size):
+            batch = ids[i:i + self.batch_size]
+            existing = set(vectorstore._collection.get(ids=batch, include=[])["ids"])
+            missing.extend(chunk_id for chunk_id in batch if chunk_id not in existing)
+        return missing
+    
+    def _add_in_batches(
+        self,
+        vectorstore: Chroma,
+        ids: List[str],
+        docs_by_id: Dict[str, Document],
+        embeddings_by_id: Dict[str, np.ndarray],
+        label: str,
+    ):
+        """Add embedded documents to one vector store in batch_size batches."""
+        for i in range(0, len(ids), self.batch_size):
+            batch = ids[i:i + self.batch_size]
+            self._add_embedded(
+                vectorstore,
+                batch,
+                [docs_by_id[chunk_id] for chunk_id in batch],
+                [embeddings_by_id[chunk_id] for chunk_id in batch],
             )
-            docs.append(doc)
-        return docs
+            # Positional args: formatting is skipped when INFO is filtered out
+            logger.info("Stored batch %d (%d chunks) for %s", i // self.batch_size + 1, len(batch), label)
+    
+    def _embed_chunks(
+        self,
+        chunks: List[DocumentChunk],
+        category: DocumentCategory,
+    ) -> Optional[Tuple[List[Tuple[Chroma, str, List[str]]], Dict[str, Document], Dict[str, np.ndarray]]]:
+        """
+        Embed the chunks that are missing from their target collections.
+        
+        Returns:
+            (pending writes, documents by id, embeddings by id), or None if
+            every chunk is already stored
+        """
+        # Key each document by source file + content hash; repeats within one
+        # file (possible with dedup disabled) keep the first
+        docs_by_id: Dict[str, Document] = {}
+        for chunk, doc in zip(chunks, self._chunks_to_langchain_docs(chunks)):
+            docs_by_id.setdefault(_chunk_id(chunk), doc)
+        ids = list(docs_by_id)
+        
+        # Every chunk goes to 'all'; the category copy is optional
+        targets = [(self._get_vectorstore(DocumentCategory.UNKNOWN), "all")]
+        if self.category_collections and category in COLLECTIONS:
+            targets.append((self._get_vectorstore(category), category.value))
+        
+        # Skip chunks already stored by an earlier run
+        pending = [(store, label, self._missing_ids(store, ids)) for store, label in targets]
+        to_embed = list(dict.fromkeys(chunk_id for _, _, missing in pending for chunk_id in missing))
+        if not to_embed:
+            logger.info(f"All {len(ids)} chunks for {category} already stored")
+            return None
+        
+        # Embed once; the same vectors go to the category and 'all' collections
+        embeddings = self._embed_documents([docs_by_id[chunk_id] for chunk_id in to_embed])
+        return pending, docs_by_id, dict(zip(to_embed, embeddings))
+    
+    def _write_embedded_chunks(
+        self,
+        pending: List[Tuple[Chroma, str, List[str]]],
+        docs_by_id: Dict[str, Document],
+        embeddings_by_id: Dict[str, np.ndarray],
+    ):
+        """Write embedded chunks to every collection still missing them."""
+        # Collections live in separate persist directories, so the writes can overlap
+        write_pool = self._get_write_pool()
+        futures = [
+            write_pool.submit(self._add_in_batches, store, missing, docs_by_id, embeddings_by_id, label)
+            for store, label, missing in pending
+            if missing
+        ]
+        for future in futures:
+            future.result()
+        
+        # Cached BM25 corpora of an in-process retriever are now stale
+        invalidate_collections(store._collection.name for store, _, missing in pending if missing)
     
     def _store_chunks(self, chunks: List[DocumentChunk], category: DocumentCategory):
-        """Store chunks in ChromaDB."""
+        """Store chunks in ChromaDB, keyed by chunk hash so re-ingestion is idempotent."""
         if not chunks:
             return
         
         try:
-            vectorstore = self._get_vectorstore(category)
-            
-            # Convert to LangChain documents
-            docs = self._chunks_to_langchain_docs(chunks)
-            
-            # Add in batches
-            for i in range(0, len(docs), self.batch_size):
-                batch = docs[i:i + self.batch_size]
-                vectorstore.add_documents(batch)
-                logger.info(f"Stored batch {i//self.batch_size + 1} ({len(batch)} chunks) for {category.value}")
-            
-            # Also store in 'all' collection
-            if category != DocumentCategory.UNKNOWN:
-                all_vectorstore = self._get_vectorstore(DocumentCategory.UNKNOWN)
-                for i in range(0, len(docs), self.batch_size):
-                    batch = docs[i:i + self.batch_size]
-                    all_vectorstore.add_documents(batch)
+            embedded = self._embed_chunks(chunks, category)
+            if embedded:
+                self._write_embedded_chunks(*embedded)
         
         except Exception as e:
             logger.error(f"Error storing chunks for {category}: {e}", exc_info=True)
     
+    def _embed_stage(self, embed_queue: "queue.Queue", write_queue: "queue.Queue"):
+        """Pipeline stage: embed queued chunk batches and hand them to the writer."""
+        try:
+            while (item := embed_queue.get()) is not _STAGE_DONE:
+                chunks, category = item
+                try:
+                    embedded = self._embed_chunks(chunks, category)
+                except Exception as e:
+                    logger.error(f"Error embedding chunks for {category}: {e}", exc_info=True)
+                    continue
+                if embedded:
+                    write_queue.put((embedded, category))
+        finally:
+            write_queue.put(_STAGE_DONE)
+    
+    def _write_stage(self, write_queue: "queue.Queue"):
+        """Pipeline stage: write embedded chunk batches to ChromaDB."""
+        while (item := write_queue.get()) is not _STAGE_DONE:
+            embedded, category = item
+            try:
+                self._write_embedded_chunks(*embedded)
+            except Exception as e:
+                logger.error(f"Error storing chunks for {category}: {e}", exc_info=True)
+    
+    def _flush_category(
+        self,
+        chunks_by_category: Dict[DocumentCategory, List[DocumentChunk]],
+        category: DocumentCategory,
+        embed_queue: "queue.Queue",
+    ):
+        """Hand the buffered chunks of one category to the embedding stage."""
+        chunks = chunks_by_category.pop(category, [])
+        if chunks:
+            logger.info(f"Storing {len(chunks)} chunks for category {category.value}")
+            embed_queue.put((chunks, category))
+    
     def ingest_directory(
         self,
         directory: Path,
         recursive: bool = True,
-        file_pattern: str = "*.*"
+        file_pattern: str = "*.*",
+        max_workers: Optional[int] = None,
     ) -> IngestionStats:
         """
         Ingest all supported files from a directory.
         
+        Loading and chunking run in a process pool; deduplication happens in
+        this thread while background threads embed and write earlier batches.
+        
         Args:
             directory: Directory to scan
             recursive: Scan subdirectories
             file_pattern: File pattern to match
+            max_workers: Worker processes for loading (None = CPU count, 1 = serial)
             
         Returns:
             IngestionStats with results
@@ -221,35 +581,49 @@ class RAGIngestionPipeline:
         
         logger.info(f"Starting ingestion from {directory}")
         
-        # Collect files
-        if recursive:
-            files = list(directory.rglob(file_pattern))
-        else:
-            files = list(directory.glob(file_pattern))
-        
-        # Filter to supported files
-        supported_extensions = {'.csv', '.txt', '.md', '.pdf', '.png', '.jpg', '.jpeg', '.tiff', '.bmp'}
-        files = [f for f in files if f.suffix.lower() in supported_extensions and f.is_file()]
+        # Collect supported files
+        files = list(_iter_supported_files(directory, recursive, file_pattern))
         
         logger.info(f"Found {len(files)} supported files")
         
         # Group chunks by category
         chunks_by_category = defaultdict(list)
         
-        # Process each file
-        for i, file_path in enumerate(files, 1):
-            logger.info(f"Processing file {i}/{len(files)}: {file_path.name}")
-            
-            chunks = self.ingest_file(file_path, stats)
-            
-            # Group by category
-            for chunk in chunks:
-                chunks_by_category[chunk.metadata.category].append(chunk)
+        # Chunking (this thread), embedding and writing run as overlapping
+        # stages; bounded queues apply backpressure to the faster ones
+        embed_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        write_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        stages = [
+            threading.Thread(target=self._embed_stage, args=(embed_queue, write_queue), daemon=True),
+            threading.Thread(target=self._write_stage, args=(write_queue,), daemon=True),
+        ]
+        for stage in stages:
+            stage.start()
         
-        # Store chunks by category
-        for category, chunks in chunks_by_category.items():
-            logger.info(f"Storing {len(chunks)} chunks for category {category.value}")
-            self._store_chunks(chunks, category)
+        try:
+            # Process each file
+            split_results = self._iter_split_files(files, stats, max_workers)
+            for file_path, split_docs in zip(files, split_results):
+                chunks = self._build_chunks(file_path, split_docs, stats)
+                
+                # Group by category; a file's chunks share one category, so
+                # each run is appended with a single extend
+                for category, group in groupby(chunks, key=_chunk_category):
+                    buffer = chunks_by_category[category]
+                    buffer.extend(group)
+                    
+                    # Flush full buffers so memory stays bounded by flush_threshold
+                    if len(buffer) >= self.flush_threshold:
+                        self._flush_category(chunks_by_category, category, embed_queue)
+            
+            # Store remaining chunks by category
+            for category in list(chunks_by_category):
+                self._flush_category(chunks_by_category, category, embed_queue)
+        finally:
+            embed_queue.put(_STAGE_DONE)
+            for stage in stages:
+                stage.join()
+            self.close()
         
         stats.end_time = datetime.now()
         
@@ -294,13 +668,12 @@ def ingest_all_data(
     Returns:
         IngestionStats
     """
-    pipeline = RAGIngestionPipeline(
+    with RAGIngestionPipeline(
         chunk_strategy=chunk_strategy,
         chunk_size=chunk_size,
         use_dedup=use_dedup,
-    )
-    
-    return pipeline.ingest_data_directory()
+    ) as pipeline:
+        return pipeline.ingest_data_directory()
 
 
 if __name__ == "__main__":
@@ -5,12 +5,14 @@ Supports CSV, TXT, MD, PDF (text + OCR), and images.
 """
 
 import csv
-import re
+import mmap
+import os
+import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Dict, Any
-from datetime import datetime
-
-from langchain_core.documents import Document
+from typing import List, Optional, Dict, Any, Tuple
 
 from src.rag_agent.base import (
     BaseLoader, DocumentChunk, ChunkMetadata,
@@ -20,6 +22,146 @@ from src.common.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Concurrent Tesseract processes per scanned PDF
+OCR_WORKERS = min(4, os.cpu_count() or 1)
+# Pages OCR'd per Tesseract process, and rendered batches allowed to wait
+# for a free OCR worker
+OCR_BATCH_PAGES = 8
+OCR_BATCHES_IN_FLIGHT = OCR_WORKERS * 2
+# OCR render resolution, and the retry resolution for pages whose first
+# pass yields fewer than OCR_RETRY_MIN_CHARS characters
+OCR_DPI = 100
+OCR_RETRY_DPI = 200
+OCR_RETRY_MIN_CHARS = 50
+
+
+@lru_cache()
+def get_ocr_modules():
+    """
+    Import the optional OCR dependencies once and configure Tesseract.
+    
+    Returns:
+        (pytesseract module, PIL.Image module)
+        
+    Raises:
+        ImportError: If pytesseract or Pillow is not installed
+    """
+    import pytesseract
+    from PIL import Image
+    from src.config.settings import get_settings
+    
+    # Configure Tesseract path
+    settings = get_settings()
+    if settings.tesseract_cmd:
+        pytesseract.pytesseract.tesseract_cmd = settings.tesseract_cmd
+    
+    return pytesseract, Image
+
+
+def _ocr_image_files(image_paths: List[str], list_path: str) -> List[str]:
+    """
+    OCR several image files in one Tesseract process.
+    
+    Tesseract reads a text file listing the images and ends each page's
+    text with a form feed. If the output does not split into one text per
+    image, falls back to one call per image.
+    
+    Args:
+        image_paths: Images to OCR, in order
+        list_path: Where to write the image list
+        
+    Returns:
+        OCR text per image
+    """
+    pytesseract, _ = get_ocr_modules()
+    with open(list_path, 'w', encoding='utf-8') as f:
+        f.write("\n".join(image_paths) + "\n")
+    
+    texts = pytesseract.image_to_string(list_path).split("\f")
+    if len(texts) < len(image_paths):
+        return [pytesseract.image_to_string(path) for path in image_paths]
+    return texts[:len(image_paths)]
+
+
+def _ocr_pdf_pages(doc, page_nums: List[int], dpi: int) -> Dict[int, str]:
+    """
+    Render PDF pages as grayscale images and OCR them.
+    
+    This thread renders pages (fitz documents are not thread-safe) into a
+    temporary directory while worker threads OCR earlier batches of
+    OCR_BATCH_PAGES pages, one Tesseract process per batch. At most
+    OCR_BATCHES_IN_FLIGHT rendered batches wait for OCR.
+    
+    Args:
+        doc: Open PyMuPDF document
+        page_nums: Zero-based pages to OCR
+        dpi: Render resolution
+        
+    Returns:
+        Mapping of page number to OCR text
+    """
+    import fitz  # PyMuPDF
+    
+    mat = fitz.Matrix(dpi / 72, dpi / 72)
+    texts: Dict[int, str] = {}
+    
+    with tempfile.TemporaryDirectory(prefix="pdf_ocr_") as tmp_dir, \
+            ThreadPoolExecutor(max_workers=OCR_WORKERS) as executor:
+        in_flight = deque()
+        for start in range(0, len(page_nums), OCR_BATCH_PAGES):
+            if len(in_flight) >= OCR_BATCHES_IN_FLIGHT:
+                batch, future = in_flight.popleft()
+                texts.update(zip(batch, future.result()))
+            
+            batch = page_nums[start:start + OCR_BATCH_PAGES]
+            image_paths = []
+            for page_num in batch:
+                pix = doc.load_page(page_num).get_pixmap(matrix=mat, colorspace=fitz.csGRAY, alpha=False)
+                # Uncompressed PGM: no image encoding before Tesseract reads it
+                image_path = os.path.join(tmp_dir, f"page_{page_num:04d}_{dpi}.pgm")
+                pix.save(image_path)
+                image_paths.append(image_path)
+            
+            list_path = os.path.join(tmp_dir, f"batch_{start:04d}_{dpi}.txt")
+            in_flight.append((batch, executor.submit(_ocr_image_files, image_paths, list_path)))
+        
+        for batch, future in in_flight:
+            texts.update(zip(batch, future.result()))
+    
+    return texts
+
+
+# Text files at least this large are decoded straight from a memory map
+MMAP_THRESHOLD = 1 << 20
+
+
+def read_text_file(file_path: Path) -> str:
+    """
+    Read a UTF-8 text file, ignoring undecodable bytes.
+    
+    Large files are decoded directly from a read-only memory map, so no
+    intermediate bytes copy of the whole file is made. Newlines are
+    normalized to '\\n' as in text-mode reads.
+    
+    Args:
+        file_path: File to read
+        
+    Returns:
+        Decoded file content
+    """
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                content = str(mm, 'utf-8', 'ignore')
+        else:
+            content = f.read().decode('utf-8', 'ignore')
+    
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
 # Company mappings (same as existing)
 COMPANIES = {
     "BBD": {"name": "BBD Ltd", "aliases": ["BBD_LTD", "BBD Software", "BBD_Software"]},
@@ -30,25 +172,55 @@ COMPANIES = {
 }
 
 
+def _build_company_tokens() -> tuple[tuple[str, str], ...]:
+    """
+    Upper-case company ids and aliases once, in match priority order.
+    
+    A token containing an earlier token can never decide the match (the
+    earlier one is found first), so it is dropped; e.g. "BBD_LTD" is
+    covered by "BBD". This halves the substring scans per call.
+    """
+    tokens: list[tuple[str, str]] = []
+    for company_id, info in COMPANIES.items():
+        for token in (company_id, *info["aliases"]):
+            token = token.upper()
+            if not any(earlier in token for earlier, _ in tokens):
+                tokens.append((token, company_id))
+    return tuple(tokens)
+
+
+_COMPANY_TOKENS = _build_company_tokens()
+
+
 def identify_company(filename: str, content: str = "") -> str:
     """Identify company from filename and content."""
-    text_to_check = (filename + " " + content[:1000]).upper()
+    return _identify_company(filename, content[:1000])
+
+
+@lru_cache(maxsize=4096)
+def _identify_company(filename: str, content_prefix: str) -> str:
+    """Memoized company lookup; pages and re-loads of a file repeat their inputs."""
+    text_to_check = (filename + " " + content_prefix).upper()
     
-    for company_id, info in COMPANIES.items():
-        if company_id in text_to_check:
+    for token, company_id in _COMPANY_TOKENS:
+        if token in text_to_check:
             return company_id
-        for alias in info["aliases"]:
-            if alias.upper() in text_to_check:
-                return company_id
     
     return "UNKNOWN"
 
 
 def infer_category_and_type(filepath: Path, content: str = "") -> tuple[DocumentCategory, DocumentType]:
     """Infer document category and type from path and content."""
+    # Inference only looks at the path, so results are memoized per path
+    return _infer_category_and_type(filepath)
+
+
+@lru_cache(maxsize=4096)
+def _infer_category_and_type(filepath: Path) -> tuple[DocumentCategory, DocumentType]:
+    """Infer document category and type from a file path."""
+    # Lower-case once; the filename is the last component of the path
     path_str = str(filepath).lower()
-    filename = filepath.name.lower()
-    content_lower = content[:500].lower()
+    filename = path_str.rpartition(os.sep)[2]
     
     # Category inference
     category = DocumentCategory.UNKNOWN
@@ -121,6 +293,8 @@ def infer_category_and_type(filepath: Path, content: str = "") -> tuple[Document
 class CSVLoader(BaseLoader):
     """Loader for CSV files."""
     
+    EXTENSIONS = frozenset({'.csv'})
+    
     # Financial document types that need full data ingestion
     FINANCIAL_DOC_TYPES = {
         DocumentType.BALANCE_SHEET,
@@ -140,11 +314,11 @@ class CSVLoader(BaseLoader):
     
     def supports(self, file_path: Path) -> bool:
         """Check if file is CSV."""
-        return file_path.suffix.lower() == '.csv'
+        return file_path.suffix.lower() in self.EXTENSIONS
     
     def _create_financial_chunks(
         self, 
-        rows: List[Dict], 
+        rows: List[List[str]], 
         headers: List[str],
         filename: str,
         file_path: Path,
@@ -156,21 +330,20 @@ class CSVLoader(BaseLoader):
         chunks = []
         
         # Create a COMPLETE data chunk with all rows (primary chunk for retrieval)
-        full_content = f"# {filename} - Complete Financial Data\n\n"
-        full_content += f"**Company:** {company_id}\n"
-        full_content += f"**Document Type:** {doc_type.value}\n"
-        full_content += f"**Columns:** {', '.join(headers)}\n"
-        full_content += f"**Total Records:** {len(rows)}\n\n"
-        full_content += "## Complete Data\n\n"
-        
-        # Add header row
-        full_content += "| " + " | ".join(headers) + " |\n"
-        full_content += "| " + " | ".join(["---"] * len(headers)) + " |\n"
-        
-        # Add ALL data rows in table format
-        for row in rows:
-            row_values = [str(row.get(h, "")) for h in headers]
-            full_content += "| " + " | ".join(row_values) + " |\n"
+        parts = [
+            f"# {filename} - Complete Financial Data\n\n",
+            f"**Company:** {company_id}\n",
+            f"**Document Type:** {doc_type.value}\n",
+            f"**Columns:** {', '.join(headers)}\n",
+            f"**Total Records:** {len(rows)}\n\n",
+            "## Complete Data\n\n",
+            # Header row
+            "| " + " | ".join(headers) + " |\n",
+            "| " + " | ".join(["---"] * len(headers)) + " |\n",
+            # Add ALL data rows in table format, joined in one pass
+            "".join(["| " + " | ".join(row) + " |\n" for row in rows]),
+        ]
+        full_content = "".join(parts)
         
         full_metadata = ChunkMetadata(
             source=str(file_path),
@@ -189,30 +362,37 @@ class CSVLoader(BaseLoader):
             metadata=full_metadata
         ))
         
-        # Create individual row chunks for granular retrieval
+        # Create individual row chunks for granular retrieval; everything
+        # that does not depend on the row is formatted once
+        source = str(file_path)
+        total = len(rows)
+        row_preamble = f"**Company:** {company_id}\n**Document Type:** {doc_type.value}\n"
+        header_labels = [f"- **{header}:** " for header in headers]
+        
         for i, row in enumerate(rows):
-            row_label = row.get(headers[0], f"Row {i+1}") if headers else f"Row {i+1}"
+            row_label = row[0] if headers else f"Row {i+1}"
             
-            row_content = f"# {filename} - {row_label}\n\n"
-            row_content += f"**Company:** {company_id}\n"
-            row_content += f"**Document Type:** {doc_type.value}\n"
-            row_content += f"**Row:** {i+1} of {len(rows)}\n\n"
-            row_content += "## Data\n\n"
+            parts = [
+                f"# {filename} - {row_label}\n\n",
+                row_preamble,
+                f"**Row:** {i+1} of {total}\n\n",
+                "## Data\n\n",
+            ]
             
-            for header in headers:
-                value = row.get(header, "")
+            for label, value in zip(header_labels, row):
                 if value and value != "--":
-                    row_content += f"- **{header}:** {value}\n"
+                    parts.append(label + value + "\n")
+            row_content = "".join(parts)
             
             row_metadata = ChunkMetadata(
-                source=str(file_path),
+                source=source,
                 filename=filename,
                 company_id=company_id,
                 category=category,
                 doc_type=doc_type,
                 chunk_hash="",
                 chunk_index=i + 1,
-                total_chunks=len(rows) + 1,
+                total_chunks=total + 1,
                 record_count=1,
             )
             
@@ -225,33 +405,44 @@ class CSVLoader(BaseLoader):
     
     def _create_employee_chunks(
         self,
-        rows: List[Dict],
+        rows: List[List[str]],
+        headers: List[str],
         filename: str,
         file_path: Path,
         company_id: str
     ) -> List[DocumentChunk]:
         """Create chunks for employee/HR data."""
         chunks = []
+        company_col = headers.index('Company') if 'Company' in headers else None
+        
+        # Row-invariant pieces are formatted once
+        source = str(file_path)
+        total = len(rows)
+        source_line = f"**Source:** {filename}\n"
+        header_labels = [f"- **{header}:** " for header in headers]
         
         for i, row in enumerate(rows):
-            emp_content = f"# Employee Record\n\n"
-            emp_content += f"**Source:** {filename}\n"
-            emp_content += f"**Record:** {i+1} of {len(rows)}\n\n"
-            emp_content += "## Employee Details\n\n"
+            parts = [
+                "# Employee Record\n\n",
+                source_line,
+                f"**Record:** {i+1} of {total}\n\n",
+                "## Employee Details\n\n",
+            ]
             
-            for k, v in row.items():
+            for label, v in zip(header_labels, row):
                 if v and v != '--':
-                    emp_content += f"- **{k}:** {v}\n"
+                    parts.append(label + v + "\n")
+            emp_content = "".join(parts)
             
             emp_metadata = ChunkMetadata(
-                source=str(file_path),
+                source=source,
                 filename=filename,
-                company_id=row.get('Company', company_id),
+                company_id=row[company_col] if company_col is not None else company_id,
                 category=DocumentCategory.HR,
                 doc_type=DocumentType.EMPLOYEE_RECORD,
                 chunk_hash="",
                 chunk_index=i,
-                total_chunks=len(rows),
+                total_chunks=total,
             )
             
             chunks.append(DocumentChunk(
@@ -273,8 +464,16 @@ class CSVLoader(BaseLoader):
                 if not first_line.startswith('//'):
                     f.seek(0)
                 
-                reader = csv.DictReader(f)
-                rows = list(reader)
+                # Positional rows: no per-row dict; ragged rows are padded or
+                # truncated to the header width
+                reader = csv.reader(f)
+                headers = next(reader, [])
+                width = len(headers)
+                rows = [
+                    row if len(row) == width else (row + [""] * width)[:width]
+                    for row in reader
+                    if row
+                ]
                 
                 if not rows:
                     return chunks
@@ -282,7 +481,6 @@ class CSVLoader(BaseLoader):
                 # Infer category and type
                 category, doc_type = infer_category_and_type(file_path)
                 company_id = identify_company(filename)
-                headers = list(rows[0].keys()) if rows else []
                 
                 logger.info(f"Loading {filename}: {len(rows)} rows, type={doc_type.value}, company={company_id}")
                 
@@ -297,25 +495,29 @@ class CSVLoader(BaseLoader):
                 # Handle employee/HR data
                 elif doc_type == DocumentType.EMPLOYEE_RECORD:
                     chunks = self._create_employee_chunks(
-                        rows, filename, file_path, company_id
+                        rows, headers, filename, file_path, company_id
                     )
                     logger.info(f"Created {len(chunks)} employee chunks for {filename}")
                 
                 # Handle other CSV types - create comprehensive chunk
                 else:
                     # Create complete data chunk
-                    full_content = f"# {filename}\n\n"
-                    full_content += f"**Company:** {company_id}\n"
-                    full_content += f"**Category:** {category.value}\n"
-                    full_content += f"**Document Type:** {doc_type.value}\n"
-                    full_content += f"**Columns:** {', '.join(headers)}\n"
-                    full_content += f"**Total Records:** {len(rows)}\n\n"
-                    full_content += "## Complete Data\n\n"
+                    parts = [
+                        f"# {filename}\n\n",
+                        f"**Company:** {company_id}\n",
+                        f"**Category:** {category.value}\n",
+                        f"**Document Type:** {doc_type.value}\n",
+                        f"**Columns:** {', '.join(headers)}\n",
+                        f"**Total Records:** {len(rows)}\n\n",
+                        "## Complete Data\n\n",
+                    ]
                     
                     # Add all rows
+                    header_labels = [f"{header}: " for header in headers]
                     for row in rows:
-                        row_text = " | ".join([f"{k}: {v}" for k, v in row.items() if v and v != '--'])
-                        full_content += f"- {row_text}\n"
+                        row_text = " | ".join([label + v for label, v in zip(header_labels, row) if v and v != '--'])
+                        parts.append(f"- {row_text}\n")
+                    full_content = "".join(parts)
                     
                     metadata = ChunkMetadata(
                         source=str(file_path),
@@ -341,9 +543,11 @@ class CSVLoader(BaseLoader):
 class TextLoader(BaseLoader):
     """Loader for TXT and MD files."""
     
+    EXTENSIONS = frozenset({'.txt', '.md'})
+    
     def supports(self, file_path: Path) -> bool:
         """Check if file is TXT or MD."""
-        return file_path.suffix.lower() in ['.txt', '.md']
+        return file_path.suffix.lower() in self.EXTENSIONS
     
     def load(self, file_path: Path) -> List[DocumentChunk]:
         """Load text/markdown file."""
@@ -351,8 +555,7 @@ class TextLoader(BaseLoader):
         filename = file_path.name
         
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
+            content = read_text_file(file_path)
             
             # Skip comment lines
             if content.startswith('<!--'):
@@ -390,6 +593,8 @@ class TextLoader(BaseLoader):
 class PDFLoader(BaseLoader):
     """Loader for PDF files (text extraction + OCR fallback)."""
     
+    EXTENSIONS = frozenset({'.pdf'})
+    
     def __init__(self, use_ocr: bool = True):
         """
         Initialize PDF loader.
@@ -401,7 +606,7 @@ class PDFLoader(BaseLoader):
     
     def supports(self, file_path: Path) -> bool:
         """Check if file is PDF."""
-        return file_path.suffix.lower() == '.pdf'
+        return file_path.suffix.lower() in self.EXTENSIONS
     
     def load(self, file_path: Path) -> List[DocumentChunk]:
         """Load PDF file with text extraction and OCR fallback."""
@@ -410,24 +615,14 @@ class PDFLoader(BaseLoader):
         
         try:
             # Try text extraction first
-            from pypdf import PdfReader
-            
-            reader = PdfReader(str(file_path))
-            full_text = ""
-            page_texts = []
-            
-            for page_num, page in enumerate(reader.pages):
-                try:
-                    page_text = page.extract_text()
-                    page_texts.append((page_num + 1, page_text))
-                    full_text += page_text + "\n\n"
-                except Exception as e:
-                    logger.warning(f"Error extracting text from page {page_num + 1}: {e}")
+            page_texts, from_pymupdf = self._extract_page_texts(file_path)
+            full_text = "".join(page_text + "\n\n" for _, page_text in page_texts)
             
             # Check if we got meaningful text
             if len(full_text.strip()) < 100 and self.use_ocr:
                 logger.info(f"PDF {filename} appears scanned, attempting OCR...")
-                return self._load_with_ocr(file_path)
+                # PyMuPDF text does not need to be extracted again
+                return self._load_with_ocr(file_path, text_layer=full_text if from_pymupdf else None)
             
             # Infer metadata
             category, doc_type = infer_category_and_type(file_path, full_text)
@@ -473,8 +668,53 @@ class PDFLoader(BaseLoader):
         
         return chunks
     
-    def _load_with_ocr(self, file_path: Path) -> List[DocumentChunk]:
-        """Load PDF using OCR with multiple fallback methods."""
+    def _extract_page_texts(self, file_path: Path) -> Tuple[List[Tuple[int, str]], bool]:
+        """
+        Extract the text layer of each page.
+        
+        Uses PyMuPDF, which parses faster than pypdf; falls back to pypdf
+        when PyMuPDF is not installed.
+        
+        Args:
+            file_path: PDF to read
+            
+        Returns:
+            ([(page number, text)], whether PyMuPDF was used)
+        """
+        try:
+            import fitz  # PyMuPDF
+        except ImportError:
+            fitz = None
+        
+        if fitz is not None:
+            with fitz.open(str(file_path)) as doc:
+                page_texts = [
+                    (page_num + 1, doc.load_page(page_num).get_text())
+                    for page_num in range(len(doc))
+                ]
+            return page_texts, True
+        
+        from pypdf import PdfReader
+        
+        reader = PdfReader(str(file_path))
+        page_texts = []
+        
+        for page_num, page in enumerate(reader.pages):
+            try:
+                page_texts.append((page_num + 1, page.extract_text()))
+            except Exception as e:
+                logger.warning(f"Error extracting text from page {page_num + 1}: {e}")
+        
+        return page_texts, False
+    
+    def _load_with_ocr(self, file_path: Path, text_layer: Optional[str] = None) -> List[DocumentChunk]:
+        """
+        Load PDF using OCR with multiple fallback methods.
+        
+        Args:
+            file_path: PDF to load
+            text_layer: Page text already extracted with PyMuPDF, if any
+        """
         chunks = []
         filename = file_path.name
         
@@ -483,12 +723,13 @@ class PDFLoader(BaseLoader):
             import fitz  # PyMuPDF
             
             doc = fitz.open(str(file_path))
-            full_text = ""
             
-            for page_num in range(len(doc)):
-                page = doc.load_page(page_num)
-                text = page.get_text()
-                full_text += text + "\n\n"
+            if text_layer is None:
+                text_layer = "".join(
+                    doc.load_page(page_num).get_text() + "\n\n"
+                    for page_num in range(len(doc))
+                )
+            full_text = text_layer
             
             # If we got text, return it
             if full_text.strip():
@@ -514,29 +755,24 @@ class PDFLoader(BaseLoader):
             
             # If no text, try OCR using PyMuPDF to render images + pytesseract
             try:
-                import pytesseract
-                from PIL import Image
-                import io
-                from src.config.settings import get_settings
-                
-                # Configure Tesseract path
-                settings = get_settings()
-                if settings.tesseract_cmd:
-                    pytesseract.pytesseract.tesseract_cmd = settings.tesseract_cmd
+                get_ocr_modules()
                 
                 logger.info(f"PDF {filename} is scanned, using PyMuPDF + Tesseract OCR...")
                 full_text = ""
                 
-                for page_num in range(min(len(doc), 50)):  # Limit to 50 pages for performance
-                    page = doc.load_page(page_num)
-                    # Render page to image at 150 DPI for good OCR quality
-                    mat = fitz.Matrix(150/72, 150/72)
-                    pix = page.get_pixmap(matrix=mat)
-                    img_data = pix.tobytes("png")
-                    img = Image.open(io.BytesIO(img_data))
-                    
-                    # OCR the image
-                    page_text = pytesseract.image_to_string(img)
+                # Grayscale at a low DPI first; pages that yield little text are
+                # re-rendered at a higher DPI
+                page_texts = _ocr_pdf_pages(doc, list(range(min(len(doc), 50))), OCR_DPI)  # Limit to 50 pages for performance
+                sparse_pages = [
+                    page_num for page_num, page_text in page_texts.items()
+                    if len(page_text.strip()) < OCR_RETRY_MIN_CHARS
+                ]
+                if sparse_pages:
+                    for page_num, page_text in _ocr_pdf_pages(doc, sparse_pages, OCR_RETRY_DPI).items():
+                        if len(page_text.strip()) > len(page_texts[page_num].strip()):
+                            page_texts[page_num] = page_text
+                
+                for page_num, page_text in sorted(page_texts.items()):
                     if page_text.strip():
                         full_text += f"--- Page {page_num + 1} ---\n{page_text}\n\n"
                 
@@ -642,17 +878,18 @@ class PDFLoader(BaseLoader):
 class ImageLoader(BaseLoader):
     """Loader for images using OCR."""
     
+    EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.tiff', '.bmp'})
+    
     def supports(self, file_path: Path) -> bool:
         """Check if file is an image."""
-        return file_path.suffix.lower() in ['.png', '.jpg', '.jpeg', '.tiff', '.bmp']
+        return file_path.suffix.lower() in self.EXTENSIONS
     
     def load(self, file_path: Path) -> List[DocumentChunk]:
         """Load image using OCR."""
         chunks = []
         
         try:
-            import pytesseract
-            from PIL import Image
+            pytesseract, Image = get_ocr_modules()
             
             image = Image.open(file_path)
             text = pytesseract.image_to_string(image)
@@ -683,17 +920,14 @@ class ImageLoader(BaseLoader):
         return chunks
 
 
+# Shared loader instances keyed by supported extension (loaders are stateless)
+_LOADER_REGISTRY: Dict[str, BaseLoader] = {
+    ext: loader
+    for loader in (CSVLoader(), TextLoader(), PDFLoader(), ImageLoader())
+    for ext in loader.EXTENSIONS
+}
+
+
 def get_loader_for_file(file_path: Path) -> Optional[BaseLoader]:
     """Get appropriate loader for a file."""
-    loaders = [
-        CSVLoader(),
-        TextLoader(),
-        PDFLoader(),
-        ImageLoader(),
-    ]
-    
-    for loader in loaders:
-        if loader.supports(file_path):
-            return loader
-    
-    return None
+    return _LOADER_REGISTRY.get(file_path.suffix.lower())
@@ -5,7 +5,10 @@ Ensures consistent metadata values across different ingestion paths.
 Maps string values to canonical DocumentCategory and DocumentType enums.
 """
 
-from typing import Dict, Any, Optional, Tuple
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
 from src.rag_agent.base import DocumentCategory, DocumentType
 from src.common.logging_config import get_logger
 
@@ -76,6 +79,23 @@ CATEGORY_MAPPINGS: Dict[str, DocumentCategory] = {
 }
 
 
+def _build_lookup(enum_cls, mappings: Dict[str, Any]) -> Mapping[str, Any]:
+    """
+    Merge an enum's own values with its alias mappings into one read-only table.
+    
+    Aliases take precedence over enum values, matching the original
+    mapping-then-enum lookup order. Keys are interned.
+    """
+    lookup = {sys.intern(member.value): member for member in enum_cls}
+    lookup.update((sys.intern(key), value) for key, value in mappings.items())
+    return MappingProxyType(lookup)
+
+
+# Single-probe lookup tables: normalized string -> canonical enum
+_DOC_TYPE_LOOKUP = _build_lookup(DocumentType, DOC_TYPE_MAPPINGS)
+_CATEGORY_LOOKUP = _build_lookup(DocumentCategory, CATEGORY_MAPPINGS)
+
+
 def normalize_doc_type(doc_type_value: Any) -> DocumentType:
     """
     Normalize a document type value to canonical DocumentType enum.
@@ -92,18 +112,26 @@ def normalize_doc_type(doc_type_value: Any) -> DocumentType:
     if doc_type_value is None:
         return DocumentType.UNKNOWN
     
-    # Normalize string value
-    normalized = str(doc_type_value).lower().strip().replace("-", "_").replace(" ", "_")
+    # Already-normalized strings (canonical values, the common case) resolve
+    # with a single probe; lookup keys are their own normalized form
+    if type(doc_type_value) is str:
+        hit = _DOC_TYPE_LOOKUP.get(doc_type_value)
+        if hit is not None:
+            return hit
     
-    # Check direct mapping
-    if normalized in DOC_TYPE_MAPPINGS:
-        return DOC_TYPE_MAPPINGS[normalized]
+    return _normalize_doc_type_str(str(doc_type_value))
+
+
+@lru_cache(maxsize=1024)
+def _normalize_doc_type_str(doc_type_value: str) -> DocumentType:
+    """Memoized string normalization; the same few raw values recur on every chunk."""
+    # Normalize string value
+    normalized = doc_type_value.lower().strip().replace("-", "_").replace(" ", "_")
     
-    # Try to match enum value directly
-    try:
-        return DocumentType(normalized)
-    except ValueError:
-        pass
+    # Check mappings and enum values in one lookup
+    doc_type = _DOC_TYPE_LOOKUP.get(normalized)
+    if doc_type is not None:
+        return doc_type
     
     # Log unmapped value for debugging
     logger.debug(f"Unmapped doc_type value: {doc_type_value} -> UNKNOWN")
@@ -126,23 +154,35 @@ def normalize_category(category_value: Any) -> DocumentCategory:
     if category_value is None:
         return DocumentCategory.UNKNOWN
     
-    # Normalize string value
-    normalized = str(category_value).lower().strip().replace("-", "_").replace(" ", "_")
+    # Already-normalized strings (canonical values, the common case) resolve
+    # with a single probe; lookup keys are their own normalized form
+    if type(category_value) is str:
+        hit = _CATEGORY_LOOKUP.get(category_value)
+        if hit is not None:
+            return hit
     
-    # Check direct mapping
-    if normalized in CATEGORY_MAPPINGS:
-        return CATEGORY_MAPPINGS[normalized]
+    return _normalize_category_str(str(category_value))
+
+
+@lru_cache(maxsize=1024)
+def _normalize_category_str(category_value: str) -> DocumentCategory:
+    """Memoized string normalization; the same few raw values recur on every chunk."""
+    # Normalize string value
+    normalized = category_value.lower().strip().replace("-", "_").replace(" ", "_")
     
-    # Try to match enum value directly
-    try:
-        return DocumentCategory(normalized)
-    except ValueError:
-        pass
+    # Check mappings and enum values in one lookup
+    category = _CATEGORY_LOOKUP.get(normalized)
+    if category is not None:
+        return category
     
     logger.debug(f"Unmapped category value: {category_value} -> UNKNOWN")
     return DocumentCategory.UNKNOWN
 
 
+# Metadata fields whose string values are shared by many chunks
+_INTERNED_FIELDS = ("source", "filename", "company_id")
+
+
 def normalize_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
     """
     Normalize metadata dictionary to use canonical enum values.
@@ -155,13 +195,20 @@ def normalize_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
     """
     normalized = metadata.copy()
     
+    # Intern strings repeated across every chunk of a file/company; canonical
+    # enum values and the metadata keys themselves are already interned
+    for key in _INTERNED_FIELDS:
+        value = normalized.get(key)
+        if type(value) is str:
+            normalized[key] = sys.intern(value)
+    
     # Normalize doc_type
     if "doc_type" in normalized:
         original = normalized["doc_type"]
         doc_type_enum = normalize_doc_type(original)
         normalized["doc_type"] = doc_type_enum.value
         if original != doc_type_enum.value:
-            normalized["original_doc_type"] = str(original)
+            normalized["original_doc_type"] = sys.intern(str(original))
     
     # Normalize category
     if "category" in normalized:
@@ -169,7 +216,7 @@ def normalize_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
         category_enum = normalize_category(original)
         normalized["category"] = category_enum.value
         if original != category_enum.value:
-            normalized["original_category"] = str(original)
+            normalized["original_category"] = sys.intern(str(original))
     
     return normalized
 
@@ -0,0 +1,189 @@
+"""
+Process-wide caches for RAG query work.
+
+Agent sessions repeat the same company queries across planning steps, so
+query embeddings and search results are memoized here instead of being
+recomputed on every tool call.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.config.llm_config import get_embedding_model
+from src.common.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class QueryCache:
+    """Thread-safe LRU cache with an optional time-to-live per entry."""
+
+    def __init__(self, max_size: int = 512, ttl: Optional[float] = 300, name: str = "query"):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries kept
+            ttl: Seconds an entry stays valid (None = never expires)
+            name: Label used in stats logging
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.name = name
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None and time.monotonic() - entry[0] > self.ttl:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            if (self.hits + self.misses) % 100 == 0:
+                logger.debug(
+                    f"{self.name} cache: {self.hits} hits, {self.misses} misses, "
+                    f"{self.evictions} evictions, {len(self._entries)} entries"
+                )
+            return None if entry is None else entry[1]
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Whether key has an unexpired entry; unlike get, recency and stats are untouched."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and (self.ttl is None or time.monotonic() - entry[0] <= self.ttl)
+
+    def put(self, key: Hashable, value: Any):
+        """Store a value, evicting the least recently used entries if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def put_many(self, items: Iterable[Tuple[Hashable, Any]]):
+        """Store several (key, value) pairs under one lock acquisition."""
+        with self._lock:
+            for key, value in items:
+                self.put(key, value)
+
+    def clear(self):
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+class EmbeddingCache(QueryCache):
+    """
+    LRU cache of query text -> embedding; embeddings never go stale.
+
+    Vectors are held as float32 arrays, about a tenth of the memory of a
+    list of Python floats. Chroma searches in float32, so results are
+    unchanged.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of embeddings kept
+        """
+        super().__init__(max_size=max_size, ttl=None, name="embedding")
+
+    def get(self, key: Hashable) -> Optional[List[float]]:
+        """Return the cached embedding for key, or None if missing."""
+        vector = super().get(key)
+        return None if vector is None else vector.tolist()
+
+    def put(self, key: Hashable, value: Sequence[float]):
+        """Store an embedding as a compact float32 array."""
+        super().put(key, np.asarray(value, dtype=np.float32))
+
+
+_embedding_cache = EmbeddingCache()
+_search_cache = QueryCache(max_size=512, ttl=300, name="search")
+
+
+def normalize_query(text: str) -> str:
+    """Collapse whitespace so trivially different query strings share one entry."""
+    return " ".join(text.split())
+
+
+def embed_query_cached(text: str) -> List[float]:
+    """
+    Embed a query, reusing the embedding of an identical earlier query.
+
+    Args:
+        text: Query text
+
+    Returns:
+        Query embedding
+    """
+    text = normalize_query(text)
+    embedding = _embedding_cache.get(text)
+    if embedding is None:
+        embedding = get_embedding_model().embed_query(text)
+        _embedding_cache.put(text, embedding)
+    return embedding
+
+
+def warm_embeddings(texts: Sequence[str]) -> int:
+    """
+    Embed queries ahead of use with one batched embedding call.
+
+    Args:
+        texts: Query texts expected to be searched soon
+
+    Returns:
+        Number of embeddings added to the cache
+    """
+    pending = [text for text in dict.fromkeys(normalize_query(t) for t in texts)
+               if _embedding_cache.get(text) is None]
+    if not pending:
+        return 0
+    embeddings = get_embedding_model().embed_documents(pending)
+    _embedding_cache.put_many(zip(pending, embeddings))
+    return len(pending)
+
+
+def search_cache_key(collection_name: str, query: str, filter_dict: Optional[dict], k: int) -> bytes:
+    """
+    Build the result-cache key for one similarity search.
+
+    Args:
+        collection_name: Collection searched
+        query: Search query
+        filter_dict: Chroma metadata filter
+        k: Number of results
+
+    Returns:
+        Digest identifying the search
+    """
+    raw = "|".join((
+        collection_name,
+        normalize_query(query),
+        json.dumps(filter_dict, sort_keys=True, default=str),
+        str(k),
+    ))
+    return hashlib.blake2b(raw.encode(), digest_size=16).digest()
+
+
+def get_search_cache() -> QueryCache:
+    """Get the process-wide similarity search result cache."""
+    return _search_cache
@@ -4,9 +4,13 @@ RAG Retrieval Module.
 Implements hybrid search (semantic + BM25), MMR reranking, and filtering.
 """
 
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Iterable, Tuple
 from pathlib import Path
 from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import re
+import threading
 import time
 import numpy as np
 
@@ -15,9 +19,9 @@ try:
 except ImportError:
     from langchain_community.vectorstores import Chroma
 from langchain_core.documents import Document
-from rank_bm25 import BM25Okapi
 
 from src.rag_agent.base import DocumentCategory, DocumentType, RetrievalResult
+from src.rag_agent.bm25 import BM25Index
 from src.rag_agent.metadata_normalizer import normalize_doc_type, normalize_category, normalize_metadata
 from src.config.llm_config import get_embedding_model, get_llm
 from src.config.settings import get_settings
@@ -34,6 +38,66 @@ COLLECTIONS = {
     "all": "dd_all_docs",
 }
 
+# Maximum number of stored chunks read from a collection to build its BM25 index
+BM25_CORPUS_LIMIT = 10000
+
+# Directory under the Chroma persist directory holding persisted BM25 indices
+BM25_INDEX_DIR = "bm25"
+
+# Shared pool running the BM25 half of searches alongside the semantic half;
+# one per process, so short-lived retrievers don't each leave threads behind
+_BM25_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="bm25-search")
+
+
+def build_where(filter_dict: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Convert a flat metadata filter into a Chroma ``where`` clause.
+    
+    Chroma only accepts a single key per clause, so multiple conditions are
+    combined with ``$and``.
+    """
+    if not filter_dict:
+        return None
+    if len(filter_dict) == 1:
+        return dict(filter_dict)
+    return {"$and": [{key: value} for key, value in filter_dict.items()]}
+
+
+def _doc_id(doc: Document) -> str:
+    """
+    Stable identity of a retrieved chunk, used to merge semantic and BM25 hits.
+    
+    Chunks stored by the ingestion pipeline carry their content hash as
+    ``chunk_hash`` metadata; older chunks without it are hashed here.
+    """
+    chunk_hash = doc.metadata.get("chunk_hash") if doc.metadata else None
+    if chunk_hash:
+        return chunk_hash
+    return hashlib.blake2b(doc.page_content.encode(), digest_size=8).hexdigest()
+
+
+@lru_cache(maxsize=1024)
+def _tokenize_query(query: str) -> Tuple[str, ...]:
+    """Memoized query tokenization for BM25; agents often repeat the same query."""
+    return tuple(HybridRetriever._tokenize(query))
+
+
+def _top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the k highest scores, best first, ties in index order.
+    
+    Uses a partial sort (``np.partition``) to find the k-th best score, so only
+    the candidates at or above it are fully sorted.
+    """
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k < len(scores):
+        kth_best = -np.partition(-scores, k - 1)[k - 1]
+        candidates = np.flatnonzero(scores >= kth_best)
+    else:
+        candidates = np.arange(len(scores))
+    return candidates[np.argsort(-scores[candidates], kind="stable")][:k]
+
 
 class HybridRetriever:
     """Hybrid retriever combining semantic and BM25 search with true hybrid retrieval."""
@@ -44,6 +108,8 @@ class HybridRetriever:
         bm25_weight: float = 0.3,
         use_mmr: bool = True,
         mmr_diversity: float = 0.3,
+        always_bm25: bool = False,
+        bm25_skip_relevance: float = 0.85,
     ):
         """
         Initialize hybrid retriever.
@@ -53,90 +119,239 @@ class HybridRetriever:
             bm25_weight: Weight for BM25 search (0-1)
             use_mmr: Use MMR for reranking
             mmr_diversity: Diversity parameter for MMR (0=relevance, 1=diversity)
+            always_bm25: Run BM25 even when semantic search is already confident
+            bm25_skip_relevance: Top semantic relevance (0-1) above which BM25 is skipped
         """
         self.semantic_weight = semantic_weight
         self.bm25_weight = bm25_weight
         self.use_mmr = use_mmr
         self.mmr_diversity = mmr_diversity
+        self.always_bm25 = always_bm25
+        self.bm25_skip_relevance = bm25_skip_relevance
         self.settings = get_settings()
         
         # Cache for BM25 indices per collection
-        self._bm25_cache: Dict[str, Tuple[BM25Okapi, List[Document]]] = {}
+        self._bm25_cache: Dict[str, Tuple[Optional[BM25Index], List[Document]]] = {}
         # Cache for collection documents
         self._collection_docs_cache: Dict[str, List[Document]] = {}
+        # Searches run on executor threads: the lock guards both caches, and a
+        # per-key lock makes concurrent misses wait for one fetch/build. The
+        # generation counter lets a fetch that raced an invalidation drop its result
+        self._cache_lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._cache_generation = 0
     
-    def _get_vectorstore(self, category: Optional[DocumentCategory] = None, strict: bool = False) -> Chroma:
+    def _resolve_collection(
+        self,
+        category: Optional[DocumentCategory] = None,
+        strict: bool = False,
+    ) -> Tuple[str, bool]:
         """
-        Get ChromaDB vector store.
+        Resolve which collection serves a category.
+        
+        Categories without a collection of their own on disk are served from
+        the 'all' collection, filtered on the chunk's category metadata.
         
         Args:
             category: Document category for collection selection
             strict: If True, raise error if collection not found instead of fallback
             
         Returns:
-            Chroma vectorstore instance
+            Tuple of (collection name, whether to filter by category)
         """
-        if category and category != DocumentCategory.UNKNOWN:
-            collection_name = COLLECTIONS.get(category, COLLECTIONS["all"])
-        else:
-            collection_name = COLLECTIONS["all"]
-        
-        embeddings = get_embedding_model()
-        persist_dir = Path(self.settings.chroma_persist_directory) / collection_name
+        if not category or category == DocumentCategory.UNKNOWN:
+            return COLLECTIONS["all"], False
         
-        if not persist_dir.exists():
-            if strict:
-                raise ValueError(f"Collection '{collection_name}' not found at {persist_dir}. "
-                               f"Please ensure the collection exists or use category=None for 'all'.")
-            logger.warning(f"Collection {collection_name} not found at {persist_dir}, using 'all'")
-            collection_name = COLLECTIONS["all"]
-            persist_dir = Path(self.settings.chroma_persist_directory) / collection_name
+        collection_name = COLLECTIONS.get(category)
+        if collection_name is None:
+            return COLLECTIONS["all"], True
         
+        persist_dir = Path(self.settings.chroma_persist_directory) / collection_name
+        if persist_dir.exists():
+            return collection_name, False
+        
+        if strict:
+            raise ValueError(f"Collection '{collection_name}' not found at {persist_dir}. "
+                           f"Please ensure the collection exists or use category=None for 'all'.")
+        logger.warning(f"Collection {collection_name} not found at {persist_dir}, "
+                       f"using 'all' filtered by category")
+        return COLLECTIONS["all"], True
+    
+    def _open_collection(self, collection_name: str) -> Chroma:
+        """Open a ChromaDB collection by name."""
         return Chroma(
             collection_name=collection_name,
-            embedding_function=embeddings,
-            persist_directory=str(persist_dir),
+            embedding_function=get_embedding_model(),
+            persist_directory=str(Path(self.settings.chroma_persist_directory) / collection_name),
         )
     
-    def _get_collection_documents(self, category: Optional[DocumentCategory], filter_dict: Dict[str, Any]) -> List[Document]:
+    def _get_vectorstore(self, category: Optional[DocumentCategory] = None, strict: bool = False) -> Chroma:
+        """
+        Get ChromaDB vector store.
+        
+        Args:
+            category: Document category for collection selection
+            strict: If True, raise error if collection not found instead of fallback
+            
+        Returns:
+            Chroma vectorstore instance
+        """
+        collection_name, _ = self._resolve_collection(category, strict=strict)
+        return self._open_collection(collection_name)
+    
+    def _key_lock(self, key: str) -> threading.Lock:
+        """Lock serializing the fetch or build behind one cache key."""
+        with self._cache_lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+    
+    @staticmethod
+    def _docs_cache_key(collection_name: str, filter_dict: Dict[str, Any]) -> str:
+        """Document cache key for a collection and metadata filter."""
+        return f"{collection_name}_{hash(frozenset(filter_dict.items()) if filter_dict else '')}"
+    
+    def _get_collection_documents(self, collection_name: str, filter_dict: Dict[str, Any]) -> List[Document]:
         """
         Get all documents from a collection for BM25 indexing.
         
         Args:
-            category: Document category
+            collection_name: Collection to read
             filter_dict: Metadata filters to apply
             
         Returns:
             List of documents from the collection
         """
-        cache_key = f"{category}_{hash(frozenset(filter_dict.items()) if filter_dict else '')}"
+        cache_key = self._docs_cache_key(collection_name, filter_dict)
         
-        if cache_key in self._collection_docs_cache:
-            return self._collection_docs_cache[cache_key]
+        with self._cache_lock:
+            docs = self._collection_docs_cache.get(cache_key)
+        if docs is not None:
+            return docs
         
+        with self._key_lock(f"docs:{cache_key}"):
+            with self._cache_lock:
+                docs = self._collection_docs_cache.get(cache_key)
+                generation = self._cache_generation
+            if docs is not None:
+                return docs
+            return self._fetch_collection_documents(collection_name, filter_dict, cache_key, generation)
+    
+    def _fetch_collection_documents(
+        self,
+        collection_name: str,
+        filter_dict: Dict[str, Any],
+        cache_key: str,
+        generation: int,
+    ) -> List[Document]:
+        """Read a collection's chunks and cache them unless the cache was invalidated meanwhile."""
         try:
-            vectorstore = self._get_vectorstore(category)
-            # Fetch a larger set for BM25 - get all or a large sample
-            # Use a dummy query to fetch documents (we'll filter by metadata)
-            if filter_dict:
-                docs = vectorstore.similarity_search("", k=1000, filter=filter_dict)
-            else:
-                docs = vectorstore.similarity_search("", k=1000)
+            vectorstore = self._open_collection(collection_name)
+            # Read stored chunks directly: no query embedding or vector scan needed.
+            # Metadata is normalized once here rather than on every query
+            records = vectorstore._collection.get(
+                where=build_where(filter_dict),
+                limit=BM25_CORPUS_LIMIT,
+                include=["documents", "metadatas"],
+            )
+            docs = [
+                Document(id=doc_id, page_content=text, metadata=normalize_metadata(metadata or {}))
+                for doc_id, text, metadata in zip(
+                    records["ids"], records["documents"], records["metadatas"]
+                )
+                if text is not None
+            ]
             
-            self._collection_docs_cache[cache_key] = docs
-            logger.info(f"Cached {len(docs)} documents for BM25 index (category={category})")
+            with self._cache_lock:
+                if generation == self._cache_generation:
+                    self._collection_docs_cache[cache_key] = docs
+            logger.info(f"Cached {len(docs)} documents for BM25 index (collection={collection_name})")
             return docs
         except Exception as e:
             logger.warning(f"Could not fetch collection documents: {e}")
             return []
     
-    def _build_bm25_index(self, docs: List[Document]) -> BM25Okapi:
+    @staticmethod
+    def _tokenize(text: str) -> List[str]:
+        """Tokenize text for BM25 and MMR (lower-cased whitespace split)."""
+        return text.lower().split()
+    
+    def _build_bm25_index(self, docs: List[Document]) -> Optional[BM25Index]:
         """Build BM25 index from documents."""
         if not docs:
             return None
-        # Tokenize documents (simple whitespace tokenization with basic cleaning)
-        tokenized_corpus = [doc.page_content.lower().split() for doc in docs]
-        return BM25Okapi(tokenized_corpus)
+        return BM25Index([self._tokenize(doc.page_content) for doc in docs])
+    
+    def _bm25_index_path(self, collection_key: str) -> Path:
+        """On-disk location of the persisted BM25 index for a collection key."""
+        filename = re.sub(r"[^A-Za-z0-9_.-]", "_", collection_key)
+        return Path(self.settings.chroma_persist_directory) / BM25_INDEX_DIR / f"{filename}.npz"
+    
+    @staticmethod
+    def _corpus_signature(docs: List[Document]) -> str:
+        """Content signature of an ordered corpus, from its chunk ids."""
+        digest = hashlib.blake2b(digest_size=16)
+        for doc in docs:
+            digest.update((doc.id or _doc_id(doc)).encode())
+            digest.update(b"\n")
+        return digest.hexdigest()
+    
+    def _load_or_build_bm25_index(self, docs: List[Document], collection_key: str) -> Optional[BM25Index]:
+        """
+        Load the persisted BM25 index for a corpus, building and saving it on a miss.
+        
+        The persisted index is only reused when it was built from the same
+        chunks in the same order, so a re-ingested collection is re-indexed.
+        """
+        if not docs:
+            return None
+        path = self._bm25_index_path(collection_key)
+        signature = self._corpus_signature(docs)
+        try:
+            bm25 = BM25Index.load(path, signature)
+            if bm25 is not None:
+                logger.info(f"Loaded BM25 index for {collection_key} from {path}")
+                return bm25
+        except Exception as e:
+            logger.warning(f"Could not load BM25 index from {path}: {e}")
+        
+        bm25 = self._build_bm25_index(docs)
+        try:
+            bm25.save(path, signature)
+        except Exception as e:
+            logger.warning(f"Could not persist BM25 index to {path}: {e}")
+        return bm25
+    
+    def _get_bm25_index(self, docs: List[Document], collection_key: str) -> Optional[BM25Index]:
+        """
+        Get the cached BM25 index for a collection key.
+        
+        The index is tied to the exact docs list it was built from; the
+        collection document cache hands out the same list until the collection
+        is invalidated, so a steady-state lookup is one identity check.
+        """
+        with self._cache_lock:
+            cached = self._bm25_cache.get(collection_key)
+        if cached is not None and cached[1] is docs:
+            return cached[0]
+        
+        with self._key_lock(f"bm25:{collection_key}"):
+            with self._cache_lock:
+                cached = self._bm25_cache.get(collection_key)
+            if cached is not None and cached[1] is docs:
+                return cached[0]
+            bm25 = self._load_or_build_bm25_index(docs, collection_key)
+            with self._cache_lock:
+                # Only cache an index over a corpus that is still cached; one
+                # dropped by invalidate() must not come back through this entry
+                if any(cached_docs is docs for cached_docs in self._collection_docs_cache.values()):
+                    self._bm25_cache[collection_key] = (bm25, docs)
+            return bm25
+    
+    def _bm25_index_cached(self, collection_name: str, filter_dict: Dict[str, Any], collection_key: str) -> bool:
+        """Whether a search can score BM25 from memory, without fetching or building."""
+        with self._cache_lock:
+            docs = self._collection_docs_cache.get(self._docs_cache_key(collection_name, filter_dict))
+            cached = self._bm25_cache.get(collection_key)
+        return docs is not None and cached is not None and cached[1] is docs
     
     def _get_bm25_scores(
         self,
@@ -145,36 +360,24 @@ class HybridRetriever:
         collection_key: str
     ) -> List[float]:
         """Get BM25 scores for query against documents."""
-        # Check cache
-        if collection_key not in self._bm25_cache:
-            bm25 = self._build_bm25_index(docs)
-            self._bm25_cache[collection_key] = (bm25, docs)
-        else:
-            bm25, cached_docs = self._bm25_cache[collection_key]
-            # Rebuild if docs changed
-            if len(cached_docs) != len(docs):
-                bm25 = self._build_bm25_index(docs)
-                self._bm25_cache[collection_key] = (bm25, docs)
-        
-        # Tokenize query
-        tokenized_query = query.lower().split()
-        
-        # Get scores
-        scores = bm25.get_scores(tokenized_query)
-        return scores.tolist()
-    
-    def _normalize_scores(self, scores: List[float]) -> List[float]:
-        """Normalize scores to 0-1 range."""
-        if not scores:
+        bm25 = self._get_bm25_index(docs, collection_key)
+        if bm25 is None:
             return []
+        return bm25.get_scores(_tokenize_query(query)).tolist()
+    
+    def _normalize_scores(self, scores: List[float]) -> np.ndarray:
+        """Normalize scores to 0-1 range (all 1.0 when every score is equal)."""
+        values = np.asarray(scores, dtype=np.float64)
+        if values.size == 0:
+            return values
         
-        min_score = min(scores)
-        max_score = max(scores)
+        min_score = values.min()
+        score_range = values.max() - min_score
         
-        if max_score == min_score:
-            return [1.0] * len(scores)
+        if score_range == 0:
+            return np.ones_like(values)
         
-        return [(s - min_score) / (max_score - min_score) for s in scores]
+        return (values - min_score) / score_range
     
     def _apply_mmr(
         self,
@@ -187,40 +390,111 @@ class HybridRetriever:
         if len(docs) <= top_k:
             return list(zip(docs, scores))
         
-        # Simple MMR implementation
-        selected = []
-        remaining = list(zip(docs, scores))
-        remaining.sort(key=lambda x: x[1], reverse=True)
+        # Rank candidates by relevance (stable, so ties keep their input order)
+        order = sorted(range(len(docs)), key=lambda i: scores[i], reverse=True)
+        ranked_docs = [docs[i] for i in order]
+        relevance = np.array([scores[i] for i in order], dtype=np.float64)
+        
+        # Pairwise Jaccard similarity over token sets, as one matrix product
+        token_sets = [set(self._tokenize(doc.page_content)) for doc in ranked_docs]
+        vocab: Dict[str, int] = {}
+        for tokens in token_sets:
+            for token in tokens:
+                vocab.setdefault(token, len(vocab))
+        presence = np.zeros((len(ranked_docs), len(vocab)), dtype=np.float64)
+        for row, tokens in enumerate(token_sets):
+            presence[row, [vocab[token] for token in tokens]] = 1.0
+        overlap = presence @ presence.T
+        sizes = presence.sum(axis=1)
+        union = sizes[:, None] + sizes[None, :] - overlap
+        similarity = np.divide(overlap, union, out=np.zeros_like(overlap), where=union > 0)
+        
+        # Select first (most relevant), then greedily maximize the MMR score:
+        # balance relevance against max similarity to anything already selected
+        weighted_relevance = self.mmr_diversity * relevance
+        max_similarity = similarity[0].copy()
+        picked = np.zeros(len(ranked_docs), dtype=bool)
+        picked[0] = True
+        selected = [0]
+        
+        while len(selected) < top_k:
+            mmr_scores = weighted_relevance - (1 - self.mmr_diversity) * max_similarity
+            mmr_scores[picked] = -np.inf
+            best_idx = int(np.argmax(mmr_scores))
+            picked[best_idx] = True
+            selected.append(best_idx)
+            np.maximum(max_similarity, similarity[best_idx], out=max_similarity)
+        
+        return [(ranked_docs[i], scores[order[i]]) for i in selected]
+    
+    def _semantic_search(
+        self,
+        vectorstore: Chroma,
+        query: str,
+        filter_dict: Dict[str, Any],
+        fetch_k: int,
+    ) -> Dict[str, Tuple[Document, float]]:
+        """
+        Run the semantic half of hybrid search.
+        
+        Returns:
+            Dict of doc id -> (document, relevance), relevance = 1 / (1 + distance)
+        """
+        try:
+            if filter_dict:
+                semantic_docs_with_scores = vectorstore.similarity_search_with_score(
+                    query,
+                    k=fetch_k,
+                    filter=build_where(filter_dict)
+                )
+            else:
+                semantic_docs_with_scores = vectorstore.similarity_search_with_score(query, k=fetch_k)
+        except Exception as e:
+            logger.warning(f"Semantic search failed: {e}, trying without filter")
+            semantic_docs_with_scores = vectorstore.similarity_search_with_score(query, k=fetch_k)
+        
+        # Convert similarity to relevance (lower distance = higher relevance)
+        semantic_results = {}
+        for doc, score in semantic_docs_with_scores:
+            doc_id = _doc_id(doc)
+            relevance = 1.0 / (1.0 + score)
+            semantic_results[doc_id] = (doc, relevance)
+        return semantic_results
+    
+    def _bm25_search(
+        self,
+        query: str,
+        collection_name: str,
+        filter_dict: Dict[str, Any],
+        collection_key: str,
+        fetch_k: int,
+    ) -> Dict[str, Tuple[Document, float]]:
+        """
+        Run the BM25 half of hybrid search over the cached collection corpus.
+        
+        Returns:
+            Dict of doc id -> (document, BM25 score) for the top fetch_k positive scores
+        """
+        bm25_results = {}
         
-        # Select first (most relevant)
-        selected.append(remaining.pop(0))
+        # Get collection documents for BM25
+        collection_docs = self._get_collection_documents(collection_name, filter_dict)
         
-        while len(selected) < top_k and remaining:
-            best_score = -float('inf')
-            best_idx = 0
+        if collection_docs:
+            # Build or get cached BM25 index
+            bm25 = self._get_bm25_index(collection_docs, collection_key)
             
-            for idx, (doc, relevance) in enumerate(remaining):
-                # Calculate diversity penalty
-                max_similarity = 0.0
-                for selected_doc, _ in selected:
-                    # Simple text overlap similarity
-                    overlap = len(set(doc.page_content.lower().split()) & 
-                                set(selected_doc.page_content.lower().split()))
-                    total = len(set(doc.page_content.lower().split()) | 
-                              set(selected_doc.page_content.lower().split()))
-                    similarity = overlap / total if total > 0 else 0
-                    max_similarity = max(max_similarity, similarity)
-                  # MMR score: balance relevance and diversity
-                mmr_score = (self.mmr_diversity * relevance - 
-                           (1 - self.mmr_diversity) * max_similarity)
+            if bm25:
+                bm25_scores = bm25.get_scores(_tokenize_query(query))
                 
-                if mmr_score > best_score:
-                    best_score = mmr_score
-                    best_idx = idx
-            
-            selected.append(remaining.pop(best_idx))
-        
-        return selected
+                # Get top-k BM25 results
+                top_bm25_indices = _top_k_indices(bm25_scores, fetch_k)
+                for idx in top_bm25_indices:
+                    if bm25_scores[idx] > 0:
+                        doc = collection_docs[idx]
+                        doc_id = _doc_id(doc)
+                        bm25_results[doc_id] = (doc, bm25_scores[idx])
+        return bm25_results
     
     def search(
         self,
@@ -250,10 +524,15 @@ class HybridRetriever:
         start_time = time.time()
         
         try:
-            vectorstore = self._get_vectorstore(category, strict=strict_category)
+            collection_name, filter_by_category = self._resolve_collection(
+                category, strict=strict_category
+            )
+            vectorstore = self._open_collection(collection_name)
             
             # Build metadata filter with normalized values
             filter_dict = {}
+            if filter_by_category:
+                filter_dict["category"] = category.value
             if company_id:
                 filter_dict["company_id"] = company_id
             if doc_type:
@@ -261,56 +540,38 @@ class HybridRetriever:
                 normalized_doc_type = normalize_doc_type(doc_type)
                 filter_dict["doc_type"] = normalized_doc_type.value
             
-            # === SEMANTIC SEARCH ===
-            try:
-                if filter_dict:
-                    semantic_docs_with_scores = vectorstore.similarity_search_with_score(
-                        query,
-                        k=fetch_k,
-                        filter=filter_dict
-                    )
-                else:
-                    semantic_docs_with_scores = vectorstore.similarity_search_with_score(query, k=fetch_k)
-            except Exception as e:
-                logger.warning(f"Semantic search failed: {e}, trying without filter")
-                semantic_docs_with_scores = vectorstore.similarity_search_with_score(query, k=fetch_k)
-            
-            # Convert similarity to relevance (lower distance = higher relevance)
-            semantic_results = {}
-            for doc, score in semantic_docs_with_scores:
-                doc_id = hash(doc.page_content)
-                relevance = 1.0 / (1.0 + score)
-                semantic_results[doc_id] = (doc, relevance)
-            
             # === BM25 SEARCH (True Hybrid - independent from semantic) ===
-            bm25_results = {}
+            # With a warm index BM25 scoring is cheap, so it runs after semantic
+            # search and only if needed; a cold fetch/build runs in the
+            # background while semantic search runs in this thread
             collection_key = f"{category}_{company_id}_{doc_type}"
+            bm25_future = None
+            if self.always_bm25 or not self._bm25_index_cached(collection_name, filter_dict, collection_key):
+                bm25_future = _BM25_POOL.submit(
+                    self._bm25_search, query, collection_name, filter_dict, collection_key, fetch_k
+                )
             
-            # Get collection documents for BM25
-            collection_docs = self._get_collection_documents(category, filter_dict)
+            # === SEMANTIC SEARCH ===
+            semantic_results = self._semantic_search(vectorstore, query, filter_dict, fetch_k)
             
-            if collection_docs:
-                # Build or get cached BM25 index
-                if collection_key not in self._bm25_cache:
-                    bm25 = self._build_bm25_index(collection_docs)
-                    self._bm25_cache[collection_key] = (bm25, collection_docs)
-                else:
-                    bm25, cached_docs = self._bm25_cache[collection_key]
-                    if len(cached_docs) != len(collection_docs):
-                        bm25 = self._build_bm25_index(collection_docs)
-                        self._bm25_cache[collection_key] = (bm25, collection_docs)
-                
-                if bm25:
-                    tokenized_query = query.lower().split()
-                    bm25_scores = bm25.get_scores(tokenized_query)
-                    
-                    # Get top-k BM25 results
-                    top_bm25_indices = np.argsort(bm25_scores)[-fetch_k:][::-1]
-                    for idx in top_bm25_indices:
-                        if bm25_scores[idx] > 0:
-                            doc = collection_docs[idx]
-                            doc_id = hash(doc.page_content)
-                            bm25_results[doc_id] = (doc, bm25_scores[idx])
+            # BM25 mainly helps lexical queries; skip it when semantic search
+            # already filled top_k with a confident best hit. A cold build that
+            # already started still completes and only caches a corpus that
+            # invalidate() hasn't dropped since
+            top_relevance = max((r[1] for r in semantic_results.values()), default=0.0)
+            skip_bm25 = (
+                not self.always_bm25
+                and len(semantic_results) >= top_k
+                and top_relevance > self.bm25_skip_relevance
+            )
+            if skip_bm25:
+                if bm25_future is not None:
+                    bm25_future.cancel()
+                bm25_results = {}
+            elif bm25_future is not None:
+                bm25_results = bm25_future.result()
+            else:
+                bm25_results = self._bm25_search(query, collection_name, filter_dict, collection_key, fetch_k)
             
             # === MERGE RESULTS ===
             all_doc_ids = set(semantic_results.keys()) | set(bm25_results.keys())
@@ -319,57 +580,49 @@ class HybridRetriever:
                 logger.warning(f"No documents found for query: {query[:50]}...")
                 return []
             
-            # Normalize scores
-            semantic_scores_raw = [r[1] for r in semantic_results.values()] if semantic_results else [0]
-            bm25_scores_raw = [r[1] for r in bm25_results.values()] if bm25_results else [0]
+            # Align both result sets on one index; docs missing from a set score 0 there
+            doc_ids = list(all_doc_ids)
+            doc_index = {doc_id: i for i, doc_id in enumerate(doc_ids)}
+            merged_docs: List[Optional[Document]] = [None] * len(doc_ids)
+            sem_norm = np.zeros(len(doc_ids))
+            bm25_norm = np.zeros(len(doc_ids))
             
-            semantic_min, semantic_max = min(semantic_scores_raw), max(semantic_scores_raw)
-            bm25_min, bm25_max = min(bm25_scores_raw), max(bm25_scores_raw)
+            if semantic_results:
+                sem_idx = [doc_index[doc_id] for doc_id in semantic_results]
+                for i, (doc, _) in zip(sem_idx, semantic_results.values()):
+                    merged_docs[i] = doc
+                sem_norm[sem_idx] = self._normalize_scores([r[1] for r in semantic_results.values()])
             
-            def normalize(val, min_v, max_v):
-                if max_v == min_v:
-                    return 1.0
-                return (val - min_v) / (max_v - min_v)
+            if bm25_results:
+                # Prefer the cached corpus copy of a doc found by both searches:
+                # its metadata was normalized once when the corpus was loaded
+                bm25_idx = [doc_index[doc_id] for doc_id in bm25_results]
+                for i, (doc, _) in zip(bm25_idx, bm25_results.values()):
+                    merged_docs[i] = doc
+                bm25_norm[bm25_idx] = self._normalize_scores([r[1] for r in bm25_results.values()])
+            prenormalized = {id(doc) for doc, _ in bm25_results.values()}
             
             # Compute hybrid scores
-            merged_results = []
-            for doc_id in all_doc_ids:
-                # Get doc from either result set
-                if doc_id in semantic_results:
-                    doc, sem_score = semantic_results[doc_id]
-                    sem_norm = normalize(sem_score, semantic_min, semantic_max)
-                else:
-                    sem_norm = 0.0
-                    doc = bm25_results[doc_id][0]
-                
-                if doc_id in bm25_results:
-                    _, bm25_score = bm25_results[doc_id]
-                    bm25_norm = normalize(bm25_score, bm25_min, bm25_max)
-                else:
-                    bm25_norm = 0.0
-                
-                hybrid_score = self.semantic_weight * sem_norm + self.bm25_weight * bm25_norm
-                merged_results.append((doc, hybrid_score))
-            
-            # Sort by hybrid score
-            merged_results.sort(key=lambda x: x[1], reverse=True)
+            hybrid_scores = self.semantic_weight * sem_norm + self.bm25_weight * bm25_norm
             
-            # Apply MMR if enabled
-            if self.use_mmr and len(merged_results) > top_k:
-                results = self._apply_mmr(
-                    [r[0] for r in merged_results], 
-                    [r[1] for r in merged_results], 
-                    query, 
-                    top_k
-                )
+            # Apply MMR if enabled, otherwise take the top_k by hybrid score
+            if self.use_mmr and len(merged_docs) > top_k:
+                results = self._apply_mmr(merged_docs, hybrid_scores.tolist(), query, top_k)
             else:
-                results = merged_results[:top_k]
+                results = [
+                    (merged_docs[i], float(hybrid_scores[i]))
+                    for i in _top_k_indices(hybrid_scores, top_k)
+                ]
             
             # Convert to RetrievalResult with normalized metadata
             retrieval_results = []
             for doc, score in results:
-                # Normalize document metadata
-                normalized_meta = normalize_metadata(doc.metadata) if doc.metadata else {}
+                # Normalize document metadata (cached corpus docs already are;
+                # copy so callers can't mutate the cache)
+                if id(doc) in prenormalized:
+                    normalized_meta = dict(doc.metadata)
+                else:
+                    normalized_meta = normalize_metadata(doc.metadata) if doc.metadata else {}
                 result = RetrievalResult(
                     content=doc.page_content,
                     score=score,
@@ -390,8 +643,30 @@ class HybridRetriever:
     
     def clear_cache(self):
         """Clear BM25 and document caches."""
-        self._bm25_cache.clear()
-        self._collection_docs_cache.clear()
+        with self._cache_lock:
+            self._cache_generation += 1
+            self._bm25_cache.clear()
+            self._collection_docs_cache.clear()
+    
+    def invalidate(self, collection_name: str):
+        """
+        Drop cached documents and BM25 indices built from a collection.
+        
+        Args:
+            collection_name: Collection whose stored chunks changed
+        """
+        prefix = f"{collection_name}_"
+        with self._cache_lock:
+            # Fetches already in flight read the old chunks; don't let them cache those
+            self._cache_generation += 1
+            stale_docs = [
+                self._collection_docs_cache.pop(key)
+                for key in list(self._collection_docs_cache)
+                if key.startswith(prefix)
+            ]
+            for key, (_, docs) in list(self._bm25_cache.items()):
+                if any(docs is stale for stale in stale_docs):
+                    del self._bm25_cache[key]
 
 
 class RAGRetriever:
@@ -547,3 +822,19 @@ def get_retriever() -> RAGRetriever:
     if _retriever_instance is None:
         _retriever_instance = RAGRetriever()
     return _retriever_instance
+
+
+def invalidate_collections(collection_names: Iterable[str]) -> None:
+    """
+    Invalidate the singleton retriever's caches for collections that changed.
+    
+    Called by the ingestion pipeline after writing; a no-op when no retriever
+    has been created in this process.
+    
+    Args:
+        collection_names: Collections whose stored chunks changed
+    """
+    if _retriever_instance is None:
+        return
+    for collection_name in collection_names:
+        _retriever_instance.hybrid_retriever.invalidate(collection_name)
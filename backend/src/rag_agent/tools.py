@@ -2,13 +2,24 @@
 """RAG Agent tools for document retrieval from ChromaDB vector stores."""
 
 import os
-from typing import Any, Optional, List
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Optional, List
 from pathlib import Path
 
+from langchain_core.documents import Document
 from langchain_core.tools import tool
 from langchain_community.vectorstores import Chroma
 
 from src.config.llm_config import get_embedding_model
+from src.rag_agent.query_cache import (
+    QueryCache,
+    embed_query_cached,
+    get_search_cache,
+    search_cache_key,
+    warm_embeddings,
+)
 from src.config.settings import get_settings
 from src.common.logging_config import get_logger
 
@@ -22,6 +33,31 @@ COLLECTIONS = {
     "all": "dd_all_docs",
 }
 
+# Category word prefixed to search_all_documents queries per collection
+CATEGORY_QUERY_LABELS = {
+    "financial": "financial",
+    "legal": "legal",
+    "hr": "HR",
+}
+
+# Longest chunk text a retriever includes per document before truncating
+MAX_DOC_CHARS = int(os.environ.get("RAG_MAX_DOC_CHARS", "2000"))
+
+# Shared pool for fanning tool searches out across collections
+_RAG_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="rag")
+
+# Tasks submitted to the RAG pool and not yet finished
+_rag_pending = 0
+_rag_pending_lock = threading.Lock()
+
+# Set once the opt-in probe query warmup has been scheduled
+_warmup_started = False
+_warmup_lock = threading.Lock()
+
+# (collection, company) pairs known to have a stored chunk; absence is never
+# cached, so a company ingested mid-session is found on its next search
+_company_presence = QueryCache(max_size=256, ttl=300, name="company presence")
+
 # Company mappings
 COMPANIES = {
     "BBD": {"name": "BBD Ltd", "aliases": ["BBD_LTD", "BBD Software", "BBD_Software"]},
@@ -31,17 +67,41 @@ COMPANIES = {
     "TECHNOBOX": {"name": "Techno Box Inc", "aliases": ["Techno_Box", "TechnoBox"]},
 }
 
+# (standard ID, upper-cased aliases) in match priority order
+_COMPANY_MATCHERS = tuple(
+    (standard_id, tuple(alias.upper() for alias in info["aliases"]))
+    for standard_id, info in COMPANIES.items()
+)
 
-def get_chroma_client():
-    """Get ChromaDB persist directory."""
+# Default queries the tools issue when the caller gives no query of its own
+_PROBE_QUERY_SUFFIXES = (
+    "financial data",
+    "complete financial data",
+    "HR employee data",
+    "employee",
+    "legal document",
+    "litigation lawsuit court case dispute",
+    "contract agreement",
+)
+
+
+@lru_cache()
+def get_chroma_client() -> Path:
+    """Get ChromaDB persist directory, creating it on first use."""
     settings = get_settings()
     persist_dir = Path(settings.chroma_persist_directory)
     persist_dir.mkdir(parents=True, exist_ok=True)
     return persist_dir
 
 
+@lru_cache(maxsize=None)
 def get_vectorstore(collection_name: str) -> Chroma:
-    """Get or create a ChromaDB vector store."""
+    """
+    Get or create a ChromaDB vector store.
+    
+    Cached per collection so every tool call reuses one open client instead
+    of reloading the collection from disk.
+    """
     embeddings = get_embedding_model()
     persist_directory = str(get_chroma_client() / collection_name)
     os.makedirs(persist_directory, exist_ok=True)
@@ -53,14 +113,218 @@ def get_vectorstore(collection_name: str) -> Chroma:
     )
 
 
+def warm_probe_queries() -> int:
+    """
+    Embed every company's default probe queries in one batched call.
+    
+    Call this at server startup to take the embedding round-trip off the
+    first tool calls. Failures are logged, never raised.
+    
+    Returns:
+        Number of embeddings added to the cache
+    """
+    queries = [f"{company_id} {suffix}" for company_id in COMPANIES for suffix in _PROBE_QUERY_SUFFIXES]
+    try:
+        added = warm_embeddings(queries)
+        logger.info(f"Warmed {added} probe query embeddings")
+        return added
+    except Exception as e:
+        logger.warning(f"Probe query warmup failed: {e}")
+        return 0
+
+
+def _rag_task_done(future: Optional[Future]):
+    """Done callback keeping the RAG pool's pending-task count."""
+    global _rag_pending
+    with _rag_pending_lock:
+        _rag_pending -= 1
+
+
+def _submit_rag(fn: Callable, *args) -> Future:
+    """Submit work to the shared RAG pool, counting it as pending until it finishes."""
+    global _rag_pending
+    with _rag_pending_lock:
+        _rag_pending += 1
+    try:
+        future = _RAG_POOL.submit(fn, *args)
+    except BaseException:
+        _rag_task_done(None)
+        raise
+    future.add_done_callback(_rag_task_done)
+    return future
+
+
+def _start_warmup_once():
+    """Schedule warm_probe_queries on the RAG pool on first use, if RAG_WARMUP=1."""
+    global _warmup_started
+    if _warmup_started:
+        return
+    with _warmup_lock:
+        if _warmup_started:
+            return
+        _warmup_started = True
+    if os.environ.get("RAG_WARMUP", "0") == "1":
+        _submit_rag(warm_probe_queries)
+
+
+def search_vectorstore(
+    vectorstore: Chroma,
+    query: str,
+    k: int,
+    filter: Optional[dict] = None,
+) -> List[Document]:
+    """
+    Similarity search using a cached query embedding.
+    
+    Queries the Chroma collection directly so the metadata filter is applied
+    inside the query, and skips fetching the distances nothing here reads.
+    Results are cached per (collection, query, filter, k) for a few minutes,
+    so repeated tool calls within a session skip Chroma entirely.
+    
+    Args:
+        vectorstore: Collection to search
+        query: Search query
+        k: Number of documents to return
+        filter: Optional Chroma metadata filter
+    
+    Returns:
+        Matching documents, most similar first
+    """
+    _start_warmup_once()
+    cache = get_search_cache()
+    key = search_cache_key(vectorstore._collection.name, query, filter, k)
+    docs = cache.get(key)
+    if docs is None:
+        records = vectorstore._collection.query(
+            query_embeddings=[embed_query_cached(query)],
+            n_results=k,
+            where=filter,
+            include=["documents", "metadatas"],
+        )
+        docs = [
+            Document(page_content=text, metadata=metadata or {})
+            for text, metadata in zip(records["documents"][0], records["metadatas"][0])
+        ]
+        cache.put(key, docs)
+    return list(docs)
+
+
+def company_has_docs(vectorstore: Chroma, company_id: str) -> bool:
+    """
+    Check whether a collection holds any chunk for a company.
+    
+    A one-row metadata read. A positive answer is cached for a few minutes
+    per (collection, company); a negative one is re-checked on every call,
+    because ingestion can add the company at any time. Errors count as
+    "has docs" so callers fall back to searching.
+    """
+    key = (vectorstore._collection.name, company_id)
+    if _company_presence.get(key):
+        return True
+    try:
+        records = vectorstore._collection.get(where={"company_id": company_id}, limit=1, include=[])
+    except Exception as e:
+        logger.warning(f"Could not check stored documents for {company_id}: {e}")
+        return True
+    has_docs = bool(records["ids"])
+    if has_docs:
+        _company_presence.put(key, True)
+    return has_docs
+
+
+def _build_filter(**conditions: Any) -> dict:
+    """
+    Build a Chroma metadata filter from field=value conditions.
+    
+    Conditions are sorted by field, so the same conditions always produce
+    the same filter (and the same search-cache key) whatever the call site.
+    Returned filters are shared and must not be modified.
+    
+    Args:
+        **conditions: Metadata fields and the values they must equal
+    
+    Returns:
+        A single-field filter, or an ``$and`` of one filter per field
+    """
+    return _canonical_filter(tuple(sorted(conditions.items())))
+
+
+@lru_cache(maxsize=1024)
+def _canonical_filter(conditions: tuple) -> dict:
+    """Memoized filter construction over sorted (field, value) pairs."""
+    if len(conditions) == 1:
+        field, value = conditions[0]
+        return {field: value}
+    return {"$and": [{field: value} for field, value in conditions]}
+
+
+def _search_collection(collection_name: str, query: str, k: int, filter: Optional[dict]) -> List[Document]:
+    """Open a collection and search it; runs on the shared RAG thread pool."""
+    return search_vectorstore(get_vectorstore(collection_name), query, k=k, filter=filter)
+
+
+def _legal_multi_search(company_id: str, queries: List[str], k: int) -> List[Document]:
+    """
+    Search a company's legal documents with several queries at once.
+    
+    All queries are embedded in one batched call, so the sibling legal
+    tool, usually called next, skips its embedding. Only the first query's
+    results are awaited; when the shared RAG pool is idle, uncached sibling
+    queries are also searched on it so that tool hits the search cache.
+    
+    Args:
+        company_id: Normalized company ID
+        queries: Search queries, the one to return results for first
+        k: Number of documents per query
+    
+    Returns:
+        Matching documents for the first query
+    """
+    warm_embeddings(queries)
+    filter = _build_filter(company_id=company_id)
+    # Speculative work only on spare capacity: never queue behind real searches
+    if _rag_pending == 0:
+        search_cache = get_search_cache()
+        for query in queries[1:]:
+            if search_cache_key(COLLECTIONS["legal"], query, filter, k) not in search_cache:
+                _submit_rag(_search_collection, COLLECTIONS["legal"], query, k, filter)
+    return _search_collection(COLLECTIONS["legal"], queries[0], k, filter)
+
+
+def _company_metadatas(collection_name: str, company_id: str) -> List[dict]:
+    """
+    Read the metadata of every chunk a company has in a collection.
+    
+    A metadata-only read: no embedding call or vector search is needed just
+    to count documents. Runs on the shared RAG thread pool.
+    """
+    records = get_vectorstore(collection_name)._collection.get(
+        where={"company_id": company_id},
+        include=["metadatas"],
+    )
+    return records["metadatas"] or []
+
+
+def _truncate_content(content: str) -> str:
+    """Cap a chunk's text at MAX_DOC_CHARS so a few large chunks can't flood the tool output."""
+    if len(content) <= MAX_DOC_CHARS:
+        return content
+    return content[:MAX_DOC_CHARS] + "…[truncated]"
+
+
 def normalize_company_id(company_id: str) -> str:
     """Normalize company ID to standard format."""
-    company_id = company_id.upper().strip()
-    for standard_id, info in COMPANIES.items():
+    return _normalize_company_key(company_id.upper().strip())
+
+
+@lru_cache(maxsize=256)
+def _normalize_company_key(company_id: str) -> str:
+    """Resolve an upper-cased company ID; memoized since agents repeat the same few IDs."""
+    for standard_id, aliases in _COMPANY_MATCHERS:
         if company_id == standard_id:
             return standard_id
-        for alias in info["aliases"]:
-            if alias.upper() in company_id or company_id in alias.upper():
+        for alias in aliases:
+            if alias in company_id or company_id in alias:
                 return standard_id
     return company_id
 
@@ -86,65 +350,68 @@ def retrieve_financial_documents(
         vectorstore = get_vectorstore(COLLECTIONS["financial"])
         normalized_id = normalize_company_id(company_id)
         
+        # Companies with nothing stored here skip both the filtered and fallback searches
+        if not company_has_docs(vectorstore, normalized_id):
+            return f"No financial documents found for {company_id}"
+        
         search_query = f"{normalized_id} {query}".strip() if query else f"{normalized_id} financial data"
         
         # PRIORITY 1: Retrieve COMPLETE financial documents first
         # These contain all metrics needed for ratio calculations
         complete_docs = []
         try:
-            complete_docs = vectorstore.similarity_search(
+            complete_docs = search_vectorstore(
+                vectorstore,
                 f"{normalized_id} complete financial data",
                 k=10,  # Get all complete docs for this company
-                filter={
-                    "$and": [
-                        {"company_id": normalized_id},
-                        {"data_complete": True}
-                    ]
-                }
+                filter=_build_filter(company_id=normalized_id, data_complete=True)
             )
             logger.info(f"Retrieved {len(complete_docs)} complete financial documents for {normalized_id}")
         except Exception as e:
             logger.warning(f"Could not filter by data_complete, trying alternative: {e}")
             # Some ChromaDB versions don't support $and, try without
-            all_docs = vectorstore.similarity_search(
+            all_docs = search_vectorstore(
+                vectorstore,
                 f"{normalized_id} complete financial data",
                 k=20,
-                filter={"company_id": normalized_id}
+                filter=_build_filter(company_id=normalized_id)
             )
             complete_docs = [d for d in all_docs if d.metadata.get("data_complete") == True]
         
         # PRIORITY 2: If complete docs found, use them as primary source
+        # (kept whole: the finance agent reads every metric out of them)
         if complete_docs:
-            result = f"## Complete Financial Documents for {normalized_id}\n\n"
+            parts = [f"## Complete Financial Documents for {normalized_id}\n\n"]
             for i, doc in enumerate(complete_docs, 1):
-                result += f"### {doc.metadata.get('doc_type', 'Financial Statement').replace('_', ' ').title()}\n"
-                result += f"**Source:** {doc.metadata.get('filename', 'Unknown')}\n"
-                result += f"**Records:** {doc.metadata.get('record_count', 'N/A')}\n\n"
-                result += f"{doc.page_content}\n\n---\n\n"
-            return result
+                parts.append(f"### {doc.metadata.get('doc_type', 'Financial Statement').replace('_', ' ').title()}\n")
+                parts.append(f"**Source:** {doc.metadata.get('filename', 'Unknown')}\n")
+                parts.append(f"**Records:** {doc.metadata.get('record_count', 'N/A')}\n\n")
+                parts.append(f"{doc.page_content}\n\n---\n\n")
+            return "".join(parts)
         
         # PRIORITY 3: Fall back to regular search if no complete docs
-        docs = vectorstore.similarity_search(
+        docs = search_vectorstore(
+            vectorstore,
             search_query,
             k=k,
-            filter={"company_id": normalized_id}
+            filter=_build_filter(company_id=normalized_id)
         )
         
         if not docs:
             # Fallback without filter
-            docs = vectorstore.similarity_search(search_query, k=k)
+            docs = search_vectorstore(vectorstore, search_query, k=k)
         
         if not docs:
             return f"No financial documents found for {company_id}"
         
-        result = f"## Financial Documents for {normalized_id}\n\n"
+        parts = [f"## Financial Documents for {normalized_id}\n\n"]
         for i, doc in enumerate(docs, 1):
-            result += f"### Document {i}\n"
-            result += f"**Source:** {doc.metadata.get('filename', 'Unknown')}\n"
-            result += f"**Type:** {doc.metadata.get('doc_type', 'Unknown')}\n\n"
-            result += f"{doc.page_content}\n\n---\n\n"
+            parts.append(f"### Document {i}\n")
+            parts.append(f"**Source:** {doc.metadata.get('filename', 'Unknown')}\n")
+            parts.append(f"**Type:** {doc.metadata.get('doc_type', 'Unknown')}\n\n")
+            parts.append(f"{_truncate_content(doc.page_content)}\n\n---\n\n")
         
-        return result
+        return "".join(parts)
         
     except Exception as e:
         logger.error(f"Error retrieving financial documents: {e}")
@@ -174,44 +441,44 @@ def retrieve_legal_documents(
         vectorstore = get_vectorstore(COLLECTIONS["legal"])
         normalized_id = normalize_company_id(company_id)
         
+        # Companies with nothing stored here skip both the filtered and fallback searches
+        if not company_has_docs(vectorstore, normalized_id):
+            return f"No legal documents found for {company_id}"
+        
         search_query = f"{normalized_id} {doc_type} {query}".strip()
         if not search_query:
             search_query = f"{normalized_id} legal document"
         
         # Build filter using ChromaDB $and syntax for multiple conditions
         if doc_type and normalized_id:
-            filter_dict = {
-                "$and": [
-                    {"company_id": normalized_id},
-                    {"doc_type": doc_type}
-                ]
-            }
+            filter_dict = _build_filter(company_id=normalized_id, doc_type=doc_type)
         elif normalized_id:
-            filter_dict = {"company_id": normalized_id}
+            filter_dict = _build_filter(company_id=normalized_id)
         else:
             filter_dict = None
         
-        docs = vectorstore.similarity_search(
+        docs = search_vectorstore(
+            vectorstore,
             search_query,
             k=k,
             filter=filter_dict
         )
         
         if not docs:
-            docs = vectorstore.similarity_search(search_query, k=k)
+            docs = search_vectorstore(vectorstore, search_query, k=k)
         
         if not docs:
             return f"No legal documents found for {company_id}"
         
-        result = f"## Legal Documents for {normalized_id}\n\n"
+        parts = [f"## Legal Documents for {normalized_id}\n\n"]
         for i, doc in enumerate(docs, 1):
-            result += f"### Document {i}\n"
-            result += f"**Source:** {doc.metadata.get('filename', 'Unknown')}\n"
-            result += f"**Type:** {doc.metadata.get('doc_type', 'Unknown')}\n"
-            result += f"**Category:** {doc.metadata.get('category', 'legal')}\n\n"
-            result += f"{doc.page_content}\n\n---\n\n"
+            parts.append(f"### Document {i}\n")
+            parts.append(f"**Source:** {doc.metadata.get('filename', 'Unknown')}\n")
+            parts.append(f"**Type:** {doc.metadata.get('doc_type', 'Unknown')}\n")
+            parts.append(f"**Category:** {doc.metadata.get('category', 'legal')}\n\n")
+            parts.append(f"{_truncate_content(doc.page_content)}\n\n---\n\n")
         
-        return result
+        return "".join(parts)
         
     except Exception as e:
         logger.error(f"Error retrieving legal documents: {e}")
@@ -241,30 +508,35 @@ def retrieve_hr_documents(
         vectorstore = get_vectorstore(COLLECTIONS["hr"])
         normalized_id = normalize_company_id(company_id)
         
+        # Companies with nothing stored here skip both the filtered and fallback searches
+        if not company_has_docs(vectorstore, normalized_id):
+            return f"No HR documents found for {company_id}"
+        
         search_query = f"{normalized_id} {doc_type} {query}".strip()
         if not search_query:
             search_query = f"{normalized_id} HR employee data"
         
-        docs = vectorstore.similarity_search(
+        docs = search_vectorstore(
+            vectorstore,
             search_query,
             k=k,
-            filter={"company_id": normalized_id}
+            filter=_build_filter(company_id=normalized_id)
         )
         
         if not docs:
-            docs = vectorstore.similarity_search(search_query, k=k)
+            docs = search_vectorstore(vectorstore, search_query, k=k)
         
         if not docs:
             return f"No HR documents found for {company_id}"
         
-        result = f"## HR Documents for {normalized_id}\n\n"
+        parts = [f"## HR Documents for {normalized_id}\n\n"]
         for i, doc in enumerate(docs, 1):
-            result += f"### Document {i}\n"
-            result += f"**Source:** {doc.metadata.get('filename', 'Unknown')}\n"
-            result += f"**Type:** {doc.metadata.get('doc_type', 'Unknown')}\n\n"
-            result += f"{doc.page_content}\n\n---\n\n"
+            parts.append(f"### Document {i}\n")
+            parts.append(f"**Source:** {doc.metadata.get('filename', 'Unknown')}\n")
+            parts.append(f"**Type:** {doc.metadata.get('doc_type', 'Unknown')}\n\n")
+            parts.append(f"{_truncate_content(doc.page_content)}\n\n---\n\n")
         
-        return result
+        return "".join(parts)
         
     except Exception as e:
         logger.error(f"Error retrieving HR documents: {e}")
@@ -292,19 +564,21 @@ def retrieve_employee_records(
         vectorstore = get_vectorstore(COLLECTIONS["hr"])
         normalized_id = normalize_company_id(company_id)
         
+        # Companies with nothing stored here skip both the filtered and fallback searches
+        if not company_has_docs(vectorstore, normalized_id):
+            return f"No employee records found for {company_id}"
+        
         search_query = f"{normalized_id} employee {department}".strip()
         
         # Build filter using ChromaDB $and syntax for multiple conditions
-        filter_conditions = [
-            {"company_id": normalized_id},
-            {"doc_type": "employee_record"}
-        ]
+        filter_conditions = {"company_id": normalized_id, "doc_type": "employee_record"}
         if department:
-            filter_conditions.append({"department": department})
+            filter_conditions["department"] = department
         
-        filter_dict = {"$and": filter_conditions}
+        filter_dict = _build_filter(**filter_conditions)
         
-        docs = vectorstore.similarity_search(
+        docs = search_vectorstore(
+            vectorstore,
             search_query,
             k=k,
             filter=filter_dict
@@ -312,7 +586,8 @@ def retrieve_employee_records(
         
         if not docs:
             # Fallback search
-            docs = vectorstore.similarity_search(
+            docs = search_vectorstore(
+                vectorstore,
                 f"{normalized_id} employee record",
                 k=k
             )
@@ -320,13 +595,13 @@ def retrieve_employee_records(
         if not docs:
             return f"No employee records found for {company_id}"
         
-        result = f"## Employee Records for {normalized_id}\n\n"
-        result += f"**Records Found:** {len(docs)}\n\n"
+        parts = [f"## Employee Records for {normalized_id}\n\n"]
+        parts.append(f"**Records Found:** {len(docs)}\n\n")
         
         for doc in docs:
-            result += f"{doc.page_content}\n---\n"
+            parts.append(f"{_truncate_content(doc.page_content)}\n---\n")
         
-        return result
+        return "".join(parts)
         
     except Exception as e:
         logger.error(f"Error retrieving employee records: {e}")
@@ -354,16 +629,21 @@ def retrieve_contracts(
         vectorstore = get_vectorstore(COLLECTIONS["legal"])
         normalized_id = normalize_company_id(company_id)
         
+        # Companies with nothing stored here skip both the filtered and fallback searches
+        if not company_has_docs(vectorstore, normalized_id):
+            return f"No contracts found for {company_id}"
+        
         search_query = f"{normalized_id} contract {contract_type} agreement".strip()
         
-        docs = vectorstore.similarity_search(
-            search_query,
+        docs = _legal_multi_search(
+            normalized_id,
+            [search_query, f"{normalized_id} litigation lawsuit court case dispute"],
             k=k,
-            filter={"company_id": normalized_id}
         )
         
         if not docs:
-            docs = vectorstore.similarity_search(
+            docs = search_vectorstore(
+                vectorstore,
                 f"contract agreement {contract_type}",
                 k=k
             )
@@ -371,14 +651,14 @@ def retrieve_contracts(
         if not docs:
             return f"No contracts found for {company_id}"
         
-        result = f"## Contracts for {normalized_id}\n\n"
+        parts = [f"## Contracts for {normalized_id}\n\n"]
         for i, doc in enumerate(docs, 1):
-            result += f"### Contract {i}\n"
-            result += f"**Source:** {doc.metadata.get('filename', 'Unknown')}\n"
-            result += f"**Type:** {doc.metadata.get('doc_type', 'Unknown')}\n\n"
-            result += f"{doc.page_content}\n\n---\n\n"
+            parts.append(f"### Contract {i}\n")
+            parts.append(f"**Source:** {doc.metadata.get('filename', 'Unknown')}\n")
+            parts.append(f"**Type:** {doc.metadata.get('doc_type', 'Unknown')}\n\n")
+            parts.append(f"{_truncate_content(doc.page_content)}\n\n---\n\n")
         
-        return result
+        return "".join(parts)
         
     except Exception as e:
         logger.error(f"Error retrieving contracts: {e}")
@@ -404,16 +684,21 @@ def retrieve_litigation_records(
         vectorstore = get_vectorstore(COLLECTIONS["legal"])
         normalized_id = normalize_company_id(company_id)
         
+        # Companies with nothing stored here skip both the filtered and fallback searches
+        if not company_has_docs(vectorstore, normalized_id):
+            return f"No litigation records found for {company_id}"
+        
         search_query = f"{normalized_id} litigation lawsuit court case dispute"
         
-        docs = vectorstore.similarity_search(
-            search_query,
+        docs = _legal_multi_search(
+            normalized_id,
+            [search_query, f"{normalized_id} contract agreement"],
             k=k,
-            filter={"company_id": normalized_id}
         )
         
         if not docs:
-            docs = vectorstore.similarity_search(
+            docs = search_vectorstore(
+                vectorstore,
                 "litigation lawsuit court judgment penalty",
                 k=k
             )
@@ -421,14 +706,14 @@ def retrieve_litigation_records(
         if not docs:
             return f"No litigation records found for {company_id}"
         
-        result = f"## Litigation Records for {normalized_id}\n\n"
+        parts = [f"## Litigation Records for {normalized_id}\n\n"]
         for i, doc in enumerate(docs, 1):
-            result += f"### Case {i}\n"
-            result += f"**Source:** {doc.metadata.get('filename', 'Unknown')}\n"
-            result += f"**Type:** {doc.metadata.get('doc_type', 'Unknown')}\n\n"
-            result += f"{doc.page_content}\n\n---\n\n"
+            parts.append(f"### Case {i}\n")
+            parts.append(f"**Source:** {doc.metadata.get('filename', 'Unknown')}\n")
+            parts.append(f"**Type:** {doc.metadata.get('doc_type', 'Unknown')}\n\n")
+            parts.append(f"{_truncate_content(doc.page_content)}\n\n---\n\n")
         
-        return result
+        return "".join(parts)
         
     except Exception as e:
         logger.error(f"Error retrieving litigation records: {e}")
@@ -455,23 +740,31 @@ def search_all_documents(
     try:
         results = []
         normalized_id = normalize_company_id(company_id) if company_id else ""
+        filter_dict = _build_filter(company_id=normalized_id) if normalized_id else None
         
-        for category, collection_name in COLLECTIONS.items():
-            if category == "all":
-                continue
-                
+        # Each collection gets the query phrased for its own category
+        search_queries = {
+            category: f"{normalized_id} {label} {query}".strip()
+            for category, label in CATEGORY_QUERY_LABELS.items()
+        }
+        
+        try:
+            # Embed every category query in one batched call; the searches below reuse the vectors
+            warm_embeddings(list(search_queries.values()))
+        except Exception as e:
+            logger.warning(f"Error embedding search queries: {e}")
+        
+        # Search the collections concurrently, then report them in a fixed order
+        searches = [
+            (category, COLLECTIONS[category], _submit_rag(
+                _search_collection, COLLECTIONS[category], search_query, k // 3, filter_dict
+            ))
+            for category, search_query in search_queries.items()
+        ]
+        
+        for category, collection_name, future in searches:
             try:
-                vectorstore = get_vectorstore(collection_name)
-                search_query = f"{normalized_id} {query}".strip() if normalized_id else query
-                
-                if normalized_id:
-                    docs = vectorstore.similarity_search(
-                        search_query,
-                        k=k // 3,
-                        filter={"company_id": normalized_id}
-                    )
-                else:
-                    docs = vectorstore.similarity_search(search_query, k=k // 3)
+                docs = future.result()
                 
                 if docs:
                     results.append(f"\n## {category.upper()} Documents\n")
@@ -509,44 +802,43 @@ def get_company_overview(
         normalized_id = normalize_company_id(company_id)
         company_info = COMPANIES.get(normalized_id, {"name": company_id, "aliases": []})
         
-        overview = f"# Company Overview: {company_info['name']}\n\n"
-        overview += f"**ID:** {normalized_id}\n"
-        overview += f"**Aliases:** {', '.join(company_info['aliases'])}\n\n"
+        parts = [f"# Company Overview: {company_info['name']}\n\n"]
+        parts.append(f"**ID:** {normalized_id}\n")
+        parts.append(f"**Aliases:** {', '.join(company_info['aliases'])}\n\n")
         
         doc_counts = {}
         
-        for category, collection_name in COLLECTIONS.items():
-            if category == "all":
-                continue
-            
+        # Read the collections concurrently, then report them in a fixed order
+        reads = [
+            (category, collection_name, _submit_rag(_company_metadatas, collection_name, normalized_id))
+            for category, collection_name in COLLECTIONS.items()
+            if category != "all"
+        ]
+        
+        for category, collection_name, future in reads:
             try:
-                vectorstore = get_vectorstore(collection_name)
-                docs = vectorstore.similarity_search(
-                    f"{normalized_id}",
-                    k=20,
-                    filter={"company_id": normalized_id}
-                )
-                doc_counts[category] = len(docs)
+                metadatas = future.result()
+                doc_counts[category] = len(metadatas)
                 
-                if docs:
-                    overview += f"## {category.capitalize()} Documents ({len(docs)} found)\n"
+                if metadatas:
+                    parts.append(f"## {category.capitalize()} Documents ({len(metadatas)} found)\n")
                     doc_types = {}
-                    for doc in docs:
-                        dt = doc.metadata.get('doc_type', 'unknown')
+                    for metadata in metadatas:
+                        dt = (metadata or {}).get('doc_type', 'unknown')
                         doc_types[dt] = doc_types.get(dt, 0) + 1
                     
                     for dt, count in doc_types.items():
-                        overview += f"- {dt}: {count}\n"
-                    overview += "\n"
+                        parts.append(f"- {dt}: {count}\n")
+                    parts.append("\n")
             
             except Exception as e:
                 logger.warning(f"Error checking {collection_name}: {e}")
-                overview += f"## {category.capitalize()} Documents\nError: {e}\n\n"
+                parts.append(f"## {category.capitalize()} Documents\nError: {e}\n\n")
         
         total = sum(doc_counts.values())
-        overview += f"## Summary\n**Total Documents:** {total}\n"
+        parts.append(f"## Summary\n**Total Documents:** {total}\n")
         
-        return overview
+        return "".join(parts)
         
     except Exception as e:
         logger.error(f"Error getting company overview: {e}")
@@ -564,3 +856,4 @@ rag_tools = [
     search_all_documents,
     get_company_overview,
 ]
+
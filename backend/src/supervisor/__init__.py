@@ -7,7 +7,7 @@ ENHANCED v2.0:
 - Risk aggregation with weighted domain scoring
 - Master analyst for final deal recommendations
 - Support for single-domain and full analyses
-- All responses LLM-driven (no hardcoded responses)
+- Responses LLM-driven (greetings use canned replies, no LLM call)
 """
 
 from .graph import graph, build_supervisor_graph
@@ -21,8 +21,11 @@ from .prompts import (
     DOMAIN_SUMMARY_PROMPT,
     RISK_AGGREGATION_PROMPT,
     GREETING_PROMPT,
+    GREETING_RESPONSES,
     HELP_PROMPT,
     INFORMATIONAL_REDIRECT_PROMPT,
+    MA_QUESTION_PROMPT,
+    CLARIFICATION_PROMPT,
 )
 
 # Enhanced models (v2.0)
@@ -69,8 +72,11 @@ __all__ = [
     "DOMAIN_SUMMARY_PROMPT",
     "RISK_AGGREGATION_PROMPT",
     "GREETING_PROMPT",
+    "GREETING_RESPONSES",
     "HELP_PROMPT",
     "INFORMATIONAL_REDIRECT_PROMPT",
+    "MA_QUESTION_PROMPT",
+    "CLARIFICATION_PROMPT",
     
     # Models (v2.0)
     "AnalysisScope",
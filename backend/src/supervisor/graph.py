@@ -16,8 +16,11 @@ from typing import Literal, Any, List, Dict, Optional
 from langgraph.graph import StateGraph, END, START
 from langgraph.prebuilt import ToolNode
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
+import asyncio
 import json
+import random
 import time
+from functools import lru_cache
 
 from src.config.llm_config import get_llm
 from src.supervisor.state import SupervisorState
@@ -28,9 +31,12 @@ from src.supervisor.prompts import (
     INTELLIGENT_ROUTING_PROMPT,
     DOMAIN_SUMMARY_PROMPT,
     RISK_AGGREGATION_PROMPT,
-    GREETING_PROMPT,
+    GREETING_RESPONSES,
+    GREETING_KEYWORDS,
     HELP_PROMPT,
     INFORMATIONAL_REDIRECT_PROMPT,
+    MA_QUESTION_PROMPT,
+    CLARIFICATION_PROMPT,
 )
 from src.common.logging_config import get_logger, log_agent_action
 from src.common.guardrails import PIIFilter, InputValidator
@@ -63,6 +69,7 @@ from src.supervisor.models import (
 )
 
 # Import planner
+from src.supervisor.response_cache import SemanticResponseCache
 from src.supervisor.planner import (
     create_analysis_plan,
     get_next_agents,
@@ -99,6 +106,26 @@ AGENTS = {
     "rag_agent": rag_agent,
 }
 
+@lru_cache(maxsize=None)
+def get_shared_llm(temperature: float):
+    """
+    Get the process-wide LLM client for a temperature.
+    
+    Nodes reuse one client per temperature instead of building a new one
+    (and a new HTTP connection pool) on every call.
+    """
+    return get_llm(temperature=temperature)
+
+
+# Near-duplicate help requests reuse an earlier LLM response
+HELP_RESPONSE_CACHE = SemanticResponseCache(name="help")
+# Informational questions differ in one word ("capital of France" vs "of Germany"),
+# so only exact repeats are reused
+INFORMATIONAL_RESPONSE_CACHE = SemanticResponseCache(threshold=None, name="informational")
+
+# Seconds a response-cache lookup may take before the handler just calls the LLM
+RESPONSE_CACHE_LOOKUP_TIMEOUT = 2.0
+
 
 # =============================================================================
 # INTENT CLASSIFICATION NODE (Enhanced v2.0)
@@ -268,36 +295,112 @@ def route_after_intent(state: SupervisorState) -> str:
 # These nodes handle queries that don't require the full agent chain
 # =============================================================================
 
-def greeting_handler_node(state: SupervisorState) -> dict:
+def handler_messages(system_prompt: str, user_message: str) -> List[Any]:
     """
-    Handle greeting queries with a friendly, LLM-generated response.
+    Build handler LLM input with the static prompt first.
     
-    This node responds to simple greetings without invoking any agents.
-    Uses LLM to generate natural, contextual responses.
-    """
-    log_agent_action(logger, "greeting_handler", "handling_greeting", {})
+    The system prompt never varies between calls and the user's message
+    comes last, so every call shares one identical prefix that providers'
+    automatic prompt caching can reuse.
     
-    llm = get_llm(temperature=0.3)  # Slightly higher for natural greeting
-    last_message = get_last_human_message(state.messages) or "Hello"
+    Args:
+        system_prompt: Static handler instructions
+        user_message: The user's message
+        
+    Returns:
+        Messages for the LLM call
+    """
+    return [SystemMessage(content=system_prompt), HumanMessage(content=user_message)]
+
+
+def log_prompt_cache_usage(handler: str, response: AIMessage):
+    """Log how many input tokens the provider served from its prompt cache."""
+    usage = getattr(response, "usage_metadata", None) or {}
+    cache_read = (usage.get("input_token_details") or {}).get("cache_read")
+    if cache_read is not None:
+        logger.debug(f"{handler}: {cache_read}/{usage.get('input_tokens')} input tokens from prompt cache")
+
+
+async def invoke_with_response_cache(
+    cache: SemanticResponseCache,
+    user_message: str,
+    llm: Any,
+    prompt: str,
+) -> AIMessage:
+    """
+    Answer a conversational message from the response cache, or the LLM on a miss.
     
-    prompt = GREETING_PROMPT.format(user_message=last_message)
+    Cache lookups embed the message, so they run off the event loop and give
+    up after RESPONSE_CACHE_LOOKUP_TIMEOUT seconds; a slow embedding service
+    never delays the reply. Cache updates happen in the background. Cache
+    errors are logged and fall through to a normal LLM call.
     
+    Args:
+        cache: Response cache for this handler
+        user_message: The user's message
+        llm: LLM to call on a cache miss
+        prompt: Static system prompt for the LLM call
+        
+    Returns:
+        Cached or freshly generated response message
+    """
     try:
-        response = llm.invoke([SystemMessage(content=prompt)])
-        logger.info("Greeting handled successfully with LLM")
-        return {
-            "messages": [response],
-            "next_agent": "FINISH",
-        }
+        cached = await asyncio.wait_for(
+            asyncio.to_thread(cache.get, user_message),
+            timeout=RESPONSE_CACHE_LOOKUP_TIMEOUT,
+        )
+    except asyncio.TimeoutError:
+        logger.warning(f"{cache.name} response cache lookup timed out")
+        cached = None
     except Exception as e:
-        logger.error(f"Error generating greeting: {e}")
-        return {
-            "messages": [AIMessage(content="Hello! I'm your M&A Due Diligence Assistant. How can I help you today?")],
-            "next_agent": "FINISH",
-        }
+        logger.warning(f"{cache.name} response cache lookup failed: {e}")
+        cached = None
+    if cached is not None:
+        logger.info(f"Answered from {cache.name} response cache")
+        return AIMessage(content=cached)
+    
+    response = await llm.ainvoke(handler_messages(prompt, user_message))
+    log_prompt_cache_usage(cache.name, response)
+    if isinstance(response.content, str):
+        asyncio.get_running_loop().run_in_executor(
+            None, store_cached_response, cache, user_message, response.content
+        )
+    return response
+
 
+def store_cached_response(cache: SemanticResponseCache, user_message: str, content: str):
+    """Add an LLM response to a response cache; runs on a worker thread."""
+    try:
+        cache.put(user_message, content)
+    except Exception as e:
+        logger.warning(f"{cache.name} response cache update failed: {e}")
 
-def help_handler_node(state: SupervisorState) -> dict:
+
+async def greeting_handler_node(state: SupervisorState) -> dict:
+    """
+    Handle greeting queries with a canned response.
+    
+    This node responds to simple greetings without invoking any agents or
+    the LLM: a greeting needs no generation, so a pre-written variant is
+    picked by a keyword match on the user's message.
+    """
+    log_agent_action(logger, "greeting_handler", "handling_greeting", {})
+    
+    message_lower = (get_last_human_message(state.messages) or "").lower()
+    category = next(
+        (category for category, keywords in GREETING_KEYWORDS
+         if any(kw in message_lower for kw in keywords)),
+        "default",
+    )
+    
+    logger.info(f"Greeting handled with canned {category} response")
+    return {
+        "messages": [AIMessage(content=random.choice(GREETING_RESPONSES[category]))],
+        "next_agent": "FINISH",
+    }
+
+
+async def help_handler_node(state: SupervisorState) -> dict:
     """
     Handle help/capability queries with LLM-generated platform information.
     
@@ -306,13 +409,11 @@ def help_handler_node(state: SupervisorState) -> dict:
     """
     log_agent_action(logger, "help_handler", "handling_help_request", {})
     
-    llm = get_llm(temperature=0.2)
+    llm = get_shared_llm(temperature=0.2)
     last_message = get_last_human_message(state.messages) or "What can you do?"
     
-    prompt = HELP_PROMPT.format(user_message=last_message)
-    
     try:
-        response = llm.invoke([SystemMessage(content=prompt)])
+        response = await invoke_with_response_cache(HELP_RESPONSE_CACHE, last_message, llm, HELP_PROMPT)
         logger.info("Help request handled successfully with LLM")
         return {
             "messages": [response],
@@ -326,7 +427,7 @@ def help_handler_node(state: SupervisorState) -> dict:
         }
 
 
-def ma_question_handler_node(state: SupervisorState) -> dict:
+async def ma_question_handler_node(state: SupervisorState) -> dict:
     """
     Handle M&A-related questions without specific company context.
     
@@ -423,24 +524,11 @@ def ma_question_handler_node(state: SupervisorState) -> dict:
         }
     
     # Truly conceptual question - give educational answer
-    llm = get_llm(temperature=0.2)
-    
-    prompt = f"""You are an expert M&A Due Diligence consultant. The user has asked a conceptual question about M&A.
-
-User's Question: {last_message}
-
-Provide a comprehensive, educational answer that:
-1. Directly addresses their question with expert-level insight
-2. Includes relevant examples or scenarios where helpful
-3. Mentions any important considerations or nuances
-4. If applicable, explains how this relates to due diligence
-
-At the end, offer to help with specific company analysis if they'd like to proceed with actual due diligence.
-
-Respond in a professional but conversational tone:"""
+    llm = get_shared_llm(temperature=0.2)
     
     try:
-        response = llm.invoke([SystemMessage(content=prompt)])
+        response = await llm.ainvoke(handler_messages(MA_QUESTION_PROMPT, last_message))
+        log_prompt_cache_usage("ma_question_handler", response)
         logger.info("M&A question handled successfully")
         return {
             "messages": [response],
@@ -454,7 +542,7 @@ Respond in a professional but conversational tone:"""
         }
 
 
-def informational_handler_node(state: SupervisorState) -> dict:
+async def informational_handler_node(state: SupervisorState) -> dict:
     """
     Handle general informational queries not related to M&A.
     
@@ -466,14 +554,14 @@ def informational_handler_node(state: SupervisorState) -> dict:
     """
     log_agent_action(logger, "informational_handler", "handling_informational_query", {})
     
-    llm = get_llm(temperature=0.2)
+    llm = get_shared_llm(temperature=0.2)
     
     last_message = get_last_human_message(state.messages) or ""
     
-    prompt = INFORMATIONAL_REDIRECT_PROMPT.format(user_message=last_message)
-    
     try:
-        response = llm.invoke([SystemMessage(content=prompt)])
+        response = await invoke_with_response_cache(
+            INFORMATIONAL_RESPONSE_CACHE, last_message, llm, INFORMATIONAL_REDIRECT_PROMPT
+        )
         logger.info("Informational query handled successfully with LLM")
         return {
             "messages": [response],
@@ -487,6 +575,34 @@ def informational_handler_node(state: SupervisorState) -> dict:
         }
 
 
+# Focus-area rules per domain: (keywords, focus label), checked in order.
+# Keywords match as substrings of the lower-cased query.
+FOCUS_RULES = {
+    "finance": (
+        (("revenue", "sales", "top line"), "revenue and sales performance"),
+        (("profit", "margin", "earnings", "ebitda"), "profitability and margins"),
+        (("cash", "liquidity", "working capital"), "cash flow and liquidity"),
+        (("debt", "leverage", "liabilities"), "debt and leverage"),
+        (("growth", "trend", "trajectory"), "growth trends"),
+        (("valuation", "multiple", "worth"), "valuation metrics"),
+    ),
+    "legal": (
+        (("litigation", "lawsuit", "court", "sue"), "litigation and legal disputes"),
+        (("contract", "agreement"), "contracts and agreements"),
+        (("ip", "patent", "trademark", "intellectual"), "intellectual property"),
+        (("compliance", "regulatory", "regulation"), "regulatory compliance"),
+        (("risk", "liability"), "legal risks and liabilities"),
+    ),
+    "hr": (
+        (("employee", "headcount", "staff", "workforce"), "workforce and headcount"),
+        (("attrition", "turnover", "retention"), "employee retention and attrition"),
+        (("culture", "morale", "engagement"), "culture and employee engagement"),
+        (("compensation", "salary", "benefits", "pay"), "compensation and benefits"),
+        (("talent", "key person", "leadership"), "key personnel and talent"),
+    ),
+}
+
+
 def create_focused_query(original_query: str, domains: List[str]) -> str:
     """
     Create a focused query context for domain agents.
@@ -503,49 +619,16 @@ def create_focused_query(original_query: str, domains: List[str]) -> str:
     """
     query_lower = original_query.lower()
     
-    # Extract specific focus areas from the query
+    # Extract specific focus areas from the query, finance then legal then HR
     focus_areas = []
-    
-    # Finance-specific focus detection
-    if "finance" in domains:
-        if any(kw in query_lower for kw in ["revenue", "sales", "top line"]):
-            focus_areas.append("revenue and sales performance")
-        if any(kw in query_lower for kw in ["profit", "margin", "earnings", "ebitda"]):
-            focus_areas.append("profitability and margins")
-        if any(kw in query_lower for kw in ["cash", "liquidity", "working capital"]):
-            focus_areas.append("cash flow and liquidity")
-        if any(kw in query_lower for kw in ["debt", "leverage", "liabilities"]):
-            focus_areas.append("debt and leverage")
-        if any(kw in query_lower for kw in ["growth", "trend", "trajectory"]):
-            focus_areas.append("growth trends")
-        if any(kw in query_lower for kw in ["valuation", "multiple", "worth"]):
-            focus_areas.append("valuation metrics")
-    
-    # Legal-specific focus detection
-    if "legal" in domains:
-        if any(kw in query_lower for kw in ["litigation", "lawsuit", "court", "sue"]):
-            focus_areas.append("litigation and legal disputes")
-        if any(kw in query_lower for kw in ["contract", "agreement"]):
-            focus_areas.append("contracts and agreements")
-        if any(kw in query_lower for kw in ["ip", "patent", "trademark", "intellectual"]):
-            focus_areas.append("intellectual property")
-        if any(kw in query_lower for kw in ["compliance", "regulatory", "regulation"]):
-            focus_areas.append("regulatory compliance")
-        if any(kw in query_lower for kw in ["risk", "liability"]):
-            focus_areas.append("legal risks and liabilities")
-    
-    # HR-specific focus detection
-    if "hr" in domains:
-        if any(kw in query_lower for kw in ["employee", "headcount", "staff", "workforce"]):
-            focus_areas.append("workforce and headcount")
-        if any(kw in query_lower for kw in ["attrition", "turnover", "retention"]):
-            focus_areas.append("employee retention and attrition")
-        if any(kw in query_lower for kw in ["culture", "morale", "engagement"]):
-            focus_areas.append("culture and employee engagement")
-        if any(kw in query_lower for kw in ["compensation", "salary", "benefits", "pay"]):
-            focus_areas.append("compensation and benefits")
-        if any(kw in query_lower for kw in ["talent", "key person", "leadership"]):
-            focus_areas.append("key personnel and talent")
+    for domain, rules in FOCUS_RULES.items():
+        if domain not in domains:
+            continue
+        for keywords, focus_area in rules:
+            for kw in keywords:
+                if kw in query_lower:
+                    focus_areas.append(focus_area)
+                    break
     
     if focus_areas:
         return f"FOCUS ANALYSIS ON: {', '.join(focus_areas)}. Original query: {original_query}"
@@ -553,7 +636,7 @@ def create_focused_query(original_query: str, domains: List[str]) -> str:
         return f"ANALYZE: {original_query}"
 
 
-def clarification_handler_node(state: SupervisorState) -> dict:
+async def clarification_handler_node(state: SupervisorState) -> dict:
     """
     Handle actionable domain queries that need company context clarification.
     
@@ -629,7 +712,7 @@ def clarification_handler_node(state: SupervisorState) -> dict:
         }
     
     # No context - need to ask for company name
-    llm = get_llm(temperature=0.3)
+    llm = get_shared_llm(temperature=0.3)
     
     # Detect what domain they're asking about to make the clarification specific
     from src.common.intent_classifier import has_domain_keywords
@@ -647,19 +730,14 @@ def clarification_handler_node(state: SupervisorState) -> dict:
         domain_desc = [domain_names.get(d, d) for d in matched_domains]
         domain_context = f"I can see you're interested in {', '.join(domain_desc)}. "
     
-    prompt = f"""You are an M&A Due Diligence Assistant. The user asked an actionable question but didn't specify which company to analyze.
-
-User's Query: "{last_message}"
-
-{domain_context}Generate a helpful, concise clarification request that:
-1. Acknowledges what they're asking about
-2. Asks specifically which company they want to analyze
-3. Optionally mentions what analysis you can provide once they name a company
-
-Keep it friendly and under 3 sentences. Don't be overly formal."""
-
+    # Detected interest goes after the static prompt so the shared prefix stays cacheable
+    prompt = CLARIFICATION_PROMPT
+    if domain_context:
+        prompt = f"{CLARIFICATION_PROMPT}\n\nSuggested acknowledgement: {domain_context.strip()}"
+    
     try:
-        response = llm.invoke([SystemMessage(content=prompt)])
+        response = await llm.ainvoke(handler_messages(prompt, last_message))
+        log_prompt_cache_usage("clarification_handler", response)
         logger.info("Clarification request generated successfully")
         return {
             "messages": [response],
@@ -907,7 +985,7 @@ def master_analyst_node(state: SupervisorState) -> dict:
         "completed_agents": state.agents_completed,
     })
     
-    llm = get_llm(temperature=0.1)
+    llm = get_shared_llm(temperature=0.1)
     
     # Format agent outputs for the prompt
     agent_outputs_text = format_agent_outputs_for_prompt(state)
@@ -986,7 +1064,7 @@ def domain_summarizer_node(state: SupervisorState) -> dict:
         "analysis_scope": state.analysis_scope.value if state.analysis_scope else "N/A",
     })
     
-    llm = get_llm(temperature=0.1)
+    llm = get_shared_llm(temperature=0.1)
     
     # Determine which domain was analyzed
     domain = None
@@ -1264,7 +1342,7 @@ def supervisor_node(state: SupervisorState) -> dict:
     and handler nodes before reaching this node. This node is only invoked for
     MA_DUE_DILIGENCE intents with company names.
     """
-    llm = get_llm(temperature=0.0)
+    llm = get_shared_llm(temperature=0.0)
     
     # Validate input
     validator = InputValidator()
@@ -1659,7 +1737,7 @@ def human_review_node(state: SupervisorState) -> dict:
         "reason": state.human_review_reason or "High risk or critical decision required"
     })
     
-    llm = get_llm(temperature=0.1)
+    llm = get_shared_llm(temperature=0.1)
     
     # Gather context for the review request
     review_reason = state.human_review_reason or "High risk factors identified"
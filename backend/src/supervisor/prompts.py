@@ -390,6 +390,61 @@ User's greeting: {user_message}
 Respond naturally:"""
 
 
+# =============================================================================
+# GREETING RESPONSES (canned, no LLM call)
+# =============================================================================
+
+_GREETING_BODY = """I can help you with:
+- 📊 **Financial Due Diligence** - revenue, profitability, cash flow and debt analysis
+- ⚖️ **Legal Due Diligence** - contracts, litigation, IP and regulatory compliance
+- 👥 **HR Due Diligence** - workforce metrics, attrition and key person risks
+- 🎯 **Strategic Analysis** - synergies, deal risks and go/no-go recommendations
+
+Try asking:
+- "Analyze BBD Ltd for acquisition"
+- "What are the legal risks at Supernova Inc?"
+- "How is Techno Box's employee attrition?"
+
+How can I help you today?"""
+
+_GREETING_OPENERS = {
+    "good_morning": [
+        "Good morning! ☀️ Welcome to the M&A Due Diligence Assistant.",
+        "Good morning! 👋 I'm your M&A Due Diligence Assistant.",
+        "Morning! ☀️ Ready to dig into some due diligence?",
+    ],
+    "good_afternoon": [
+        "Good afternoon! 👋 Welcome to the M&A Due Diligence Assistant.",
+        "Good afternoon! I'm your M&A Due Diligence Assistant.",
+        "Afternoon! 👋 Ready to dig into some due diligence?",
+    ],
+    "good_evening": [
+        "Good evening! 🌙 Welcome to the M&A Due Diligence Assistant.",
+        "Good evening! 👋 I'm your M&A Due Diligence Assistant.",
+        "Evening! 🌙 Ready to dig into some due diligence?",
+    ],
+    "default": [
+        "Hello! 👋 Welcome to the M&A Due Diligence Assistant.",
+        "Hi there! 👋 I'm your M&A Due Diligence Assistant.",
+        "Hey! 👋 Great to see you on the M&A Due Diligence platform.",
+        "Welcome! 🤝 I'm your M&A Due Diligence Assistant.",
+    ],
+}
+
+# Greeting category -> full response variants
+GREETING_RESPONSES = {
+    category: [f"{opener}\n\n{_GREETING_BODY}" for opener in openers]
+    for category, openers in _GREETING_OPENERS.items()
+}
+
+# (category, keywords) checked in order against the lower-cased greeting
+GREETING_KEYWORDS = (
+    ("good_morning", ("morning",)),
+    ("good_afternoon", ("afternoon",)),
+    ("good_evening", ("evening",)),
+)
+
+
 # =============================================================================
 # HELP PROMPT (LLM-driven)
 # =============================================================================
@@ -415,9 +470,7 @@ Provide a comprehensive but organized response that covers:
 - To perform analysis, the user should provide target company name (and optionally acquirer)
 - They can ask for specific types of analysis (e.g., "just financial" or "focus on legal risks")
 
-User's help request: {user_message}
-
-Respond in a clear, organized format using markdown:"""
+Respond to the user's help request in a clear, organized format using markdown."""
 
 
 # =============================================================================
@@ -426,8 +479,6 @@ Respond in a clear, organized format using markdown:"""
 
 INFORMATIONAL_REDIRECT_PROMPT = """You are an M&A Due Diligence Assistant. The user has asked a question that may not be directly related to M&A.
 
-User's Question: {user_message}
-
 If this question IS related to M&A, business, finance, legal, or HR topics:
 - Provide helpful, accurate information
 - Connect it to M&A context where relevant
@@ -440,5 +491,36 @@ If this question is NOT related to your expertise:
 
 Always be polite and helpful. Don't refuse outright - try to find a connection to your expertise if possible.
 
-Respond naturally:"""
+Respond naturally."""
+
+
+# =============================================================================
+# M&A QUESTION PROMPT (LLM-driven)
+# =============================================================================
+
+MA_QUESTION_PROMPT = """You are an expert M&A Due Diligence consultant. The user has asked a conceptual question about M&A.
+
+Provide a comprehensive, educational answer that:
+1. Directly addresses their question with expert-level insight
+2. Includes relevant examples or scenarios where helpful
+3. Mentions any important considerations or nuances
+4. If applicable, explains how this relates to due diligence
+
+At the end, offer to help with specific company analysis if they'd like to proceed with actual due diligence.
+
+Respond in a professional but conversational tone."""
+
+
+# =============================================================================
+# CLARIFICATION PROMPT (LLM-driven)
+# =============================================================================
+
+CLARIFICATION_PROMPT = """You are an M&A Due Diligence Assistant. The user asked an actionable question but didn't specify which company to analyze.
+
+Generate a helpful, concise clarification request that:
+1. Acknowledges what they're asking about
+2. Asks specifically which company they want to analyze
+3. Optionally mentions what analysis you can provide once they name a company
+
+Keep it friendly and under 3 sentences. Don't be overly formal."""
 
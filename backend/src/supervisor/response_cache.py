@@ -0,0 +1,142 @@
+"""
+Semantic response cache for the supervisor's conversational handlers.
+
+Help requests are short and highly repetitive ("what can you do?", "help",
+"what are your capabilities"). Responses are cached against the embedding of
+the user message, so a near-duplicate message is answered from the cache
+instead of another LLM call.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import List, Optional
+
+import numpy as np
+
+from src.rag_agent.query_cache import embed_query_cached, normalize_query
+from src.common.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class SemanticResponseCache:
+    """
+    Thread-safe LRU cache of responses, matched by cosine similarity of messages.
+
+    With ``threshold=None`` only exact (case- and whitespace-insensitive)
+    repeats match and nothing is embedded; use that for handlers where
+    similar-looking messages need different answers.
+    """
+
+    def __init__(self, max_size: int = 1000, threshold: Optional[float] = 0.95, name: str = "response"):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of responses kept
+            threshold: Minimum cosine similarity for a cached response to
+                match, or None for exact matches only
+            name: Label used in logging
+        """
+        self.max_size = max_size
+        self.threshold = threshold
+        self.name = name
+        # Normalized message -> (matrix row, response); order tracks recency
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._vectors: Optional[np.ndarray] = None
+        self._free_rows = list(range(max_size - 1, -1, -1))
+        self._in_use = np.zeros(max_size, dtype=bool)
+        self._row_keys: List[Optional[str]] = [None] * max_size
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(message: str) -> str:
+        """Case- and whitespace-insensitive form of a message."""
+        return normalize_query(message).lower()
+
+    @staticmethod
+    def _embed(key: str) -> np.ndarray:
+        """Unit-length float32 embedding of a normalized message."""
+        vector = np.asarray(embed_query_cached(key), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def get(self, message: str) -> Optional[str]:
+        """
+        Look up the response to a message or a near-duplicate of it.
+
+        Args:
+            message: User message
+
+        Returns:
+            Cached response text, or None on a miss
+        """
+        key = self._key(message)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if not self._entries or self.threshold is None:
+                self.misses += 1
+                return None
+
+        # Embedding is a network call on a cold cache; keep it outside the lock
+        query = self._embed(key)
+        with self._lock:
+            if self._vectors is None or not self._entries:
+                self.misses += 1
+                return None
+            similarities = self._vectors @ query
+            similarities[~self._in_use] = -np.inf
+            row = int(np.argmax(similarities))
+            if similarities[row] < self.threshold:
+                self.misses += 1
+                return None
+            cached_key = self._row_keys[row]
+            self._entries.move_to_end(cached_key)
+            self.hits += 1
+            logger.debug(
+                f"{self.name} cache: '{key}' matched '{cached_key}' "
+                f"(similarity {similarities[row]:.3f})"
+            )
+            return self._entries[cached_key][1]
+
+    def put(self, message: str, response: str):
+        """
+        Cache the response to a message, evicting the least recently used one if full.
+
+        Args:
+            message: User message
+            response: Response text to reuse for this and similar messages
+        """
+        key = self._key(message)
+        if self.threshold is None:
+            with self._lock:
+                self._entries[key] = (None, response)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+            return
+
+        vector = self._embed(key)
+        with self._lock:
+            if self._vectors is None:
+                self._vectors = np.zeros((self.max_size, len(vector)), dtype=np.float32)
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                row = entry[0]
+            else:
+                if not self._free_rows:
+                    _, (evicted_row, _) = self._entries.popitem(last=False)
+                    self._in_use[evicted_row] = False
+                    self._row_keys[evicted_row] = None
+                    self._free_rows.append(evicted_row)
+                row = self._free_rows.pop()
+            self._vectors[row] = vector
+            self._in_use[row] = True
+            self._row_keys[row] = key
+            self._entries[key] = (row, response)
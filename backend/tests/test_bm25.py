@@ -0,0 +1,92 @@
+"""Tests for the NumPy BM25 index and its on-disk persistence."""
+
+import pytest
+
+from src.rag_agent.bm25 import BM25Index
+from src.rag_agent.retrieve import _top_k_indices
+
+
+# "revenue" appears in 4 of 6 documents, so its raw IDF is negative and gets
+# floored at epsilon * average IDF; "growth" and "risk" keep positive IDFs
+CORPUS = [
+    ["revenue", "growth", "revenue"],
+    ["legal", "revenue", "risk"],
+    ["revenue", "contract"],
+    ["growth", "risk", "market", "share"],
+    ["revenue", "cash", "flow"],
+    ["employee", "policy"],
+]
+
+# Reference scores from the rank_bm25.BM25Okapi formula (k1=1.5, b=0.75, epsilon=0.25)
+EXPECTED_SCORES = {
+    ("revenue",): [0.3499435036, 0.2431555863, 0.2876654224, 0.0, 0.2431555863, 0.0],
+    ("growth", "risk"): [0.5726288426, 0.5726288426, 0.0, 0.991798839, 0.0, 0.0],
+    ("risk", "revenue", "revenue"): [0.6998870071, 1.0589400152, 0.5753308448, 0.4958994195, 0.4863111726, 0.0],
+}
+
+
+@pytest.fixture
+def index():
+    """BM25 index over the reference corpus."""
+    return BM25Index(CORPUS)
+
+
+@pytest.mark.parametrize("query", list(EXPECTED_SCORES))
+def test_scores_match_reference(index, query):
+    """Scores match the reference BM25Okapi values, including repeated query terms."""
+    assert index.get_scores(list(query)).tolist() == pytest.approx(EXPECTED_SCORES[query], abs=1e-9)
+
+
+def test_negative_idf_floored_at_epsilon(index):
+    """A term in more than half the documents gets epsilon * average IDF."""
+    revenue_idf = index.idf[index.vocab["revenue"]]
+    
+    assert index.average_idf == pytest.approx(0.9983682307, abs=1e-9)
+    assert revenue_idf == pytest.approx(0.25 * index.average_idf)
+
+
+def test_unknown_terms_score_zero(index):
+    """Query terms missing from the vocabulary contribute nothing."""
+    assert index.get_scores(["acquisition"]).tolist() == [0.0] * len(CORPUS)
+
+
+def test_top_k_order(index):
+    """Top-k selection returns the best-scoring documents, best first."""
+    assert _top_k_indices(index.get_scores(["risk", "revenue", "revenue"]), 3).tolist() == [1, 0, 2]
+    assert _top_k_indices(index.get_scores(["revenue"]), 2).tolist() == [0, 2]
+
+
+def test_save_load_round_trip(index, tmp_path):
+    """A saved index loads back with identical vocabulary and scores."""
+    path = tmp_path / "bm25" / "legal.npz"
+    index.save(path, "signature-1")
+    
+    loaded = BM25Index.load(path, "signature-1")
+    
+    assert loaded is not None
+    assert loaded.vocab == index.vocab
+    assert loaded.average_idf == index.average_idf
+    for query in EXPECTED_SCORES:
+        assert loaded.get_scores(list(query)).tolist() == index.get_scores(list(query)).tolist()
+    assert [p.name for p in path.parent.iterdir()] == ["legal.npz"]
+
+
+def test_load_rejects_signature_mismatch(index, tmp_path):
+    """An index saved for a different corpus signature is not reused."""
+    path = tmp_path / "legal.npz"
+    index.save(path, "signature-1")
+    
+    assert BM25Index.load(path, "signature-2") is None
+
+
+def test_load_rejects_parameter_mismatch(index, tmp_path):
+    """An index built with different BM25 parameters is not reused."""
+    path = tmp_path / "legal.npz"
+    index.save(path, "signature-1")
+    
+    assert BM25Index.load(path, "signature-1", k1=1.2) is None
+
+
+def test_load_missing_file(tmp_path):
+    """Loading a path that was never saved returns None."""
+    assert BM25Index.load(tmp_path / "missing.npz", "signature-1") is None
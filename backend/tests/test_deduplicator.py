@@ -0,0 +1,68 @@
+"""Tests for hybrid exact + fuzzy chunk deduplication."""
+
+from src.rag_agent.deduplicator import HybridDeduplicator
+
+
+def employee_row(emp_id, last, first, dept, salary):
+    """An employee CSV row rendered the way the CSV loader renders records."""
+    return (
+        f"# Employee Record\n\n**Source:** employee_data.csv\n\n## Employee Details\n\n"
+        f"- **Employee_Name:** {last}, {first}\n"
+        f"- **EmpID:** {emp_id}\n"
+        f"- **MarriedID:** 0\n"
+        f"- **GenderID:** 1\n"
+        f"- **Salary:** {salary}\n"
+        f"- **Termd:** 0\n"
+        f"- **State:** MA\n"
+        f"- **CitizenDesc:** US Citizen\n"
+        f"- **HispanicLatino:** No\n"
+        f"- **TermReason:** N/A-StillEmployed\n"
+        f"- **EmploymentStatus:** Active\n"
+        f"- **Department:** {dept}\n"
+        f"- **RecruitmentSource:** LinkedIn\n"
+        f"- **PerformanceScore:** Fully Meets\n"
+        f"- **DaysLateLast30:** 0\n"
+        f"- **Company:** XYZ LTD"
+    )
+
+
+ROWS = [
+    employee_row(10026, "Adinolfi", "Wilson", "Production", 62506),
+    employee_row(10084, "Ait Sidi", "Karthikeyan", "IT/IS", 104437),
+    employee_row(10196, "Akinkuolie", "Sarah", "Production", 64955),
+    employee_row(10088, "Alagbe", "Trina", "Production", 64991),
+    employee_row(10069, "Anderson", "Carol", "Production", 50825),
+]
+
+
+def sequential(dedup, texts):
+    """Reference results: is_duplicate() then add() per text."""
+    return [None if dedup.is_duplicate(text) else dedup.add(text) for text in texts]
+
+
+def test_filter_batch_matches_sequential():
+    """filter_batch gives the same results as the per-text check-and-add sequence."""
+    texts = ["Employee records export"] + ROWS + [ROWS[2], "", "  ", ROWS[0].upper(), "Employee records export"]
+    
+    assert HybridDeduplicator().filter_batch(texts) == sequential(HybridDeduplicator(), texts)
+
+
+def test_filter_batch_matches_sequential_across_batches():
+    """Splitting the input into several batches does not change the results."""
+    texts = ROWS + ROWS[:2] + [employee_row(10001, "Zamora", "Jennifer", "Sales", 220450)]
+    dedup = HybridDeduplicator()
+    
+    batched = dedup.filter_batch(texts[:3]) + dedup.filter_batch(texts[3:])
+    
+    assert batched == sequential(HybridDeduplicator(), texts)
+
+
+def test_distinct_rows_survive():
+    """Distinct records sharing label boilerplate are kept; only exact repeats are dropped."""
+    dedup = HybridDeduplicator()
+    dedup.filter_batch(["Human resources employee data for the acquisition target"])
+    
+    results = dedup.filter_batch(ROWS + [ROWS[2].lower()])
+    
+    assert all(result is not None for result in results[:-1])
+    assert results[-1] is None
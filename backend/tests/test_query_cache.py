@@ -0,0 +1,126 @@
+"""Tests for the RAG query and search result caches."""
+
+import pytest
+
+from src.rag_agent import query_cache
+from src.rag_agent.query_cache import (
+    EmbeddingCache,
+    QueryCache,
+    embed_query_cached,
+    search_cache_key,
+    warm_embeddings,
+)
+
+
+class FakeClock:
+    """Stand-in for time.monotonic that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeEmbeddings:
+    """Embedding model recording every text it embeds."""
+
+    def __init__(self):
+        self.calls = []
+
+    def embed_query(self, text):
+        self.calls.append(("query", text))
+        return [float(len(text)), 1.0]
+
+    def embed_documents(self, texts):
+        self.calls.append(("documents", list(texts)))
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Control the clock used for cache TTLs."""
+    fake = FakeClock()
+    monkeypatch.setattr(query_cache.time, "monotonic", fake)
+    return fake
+
+
+@pytest.fixture
+def embeddings(monkeypatch):
+    """Replace the embedding model and start from an empty embedding cache."""
+    model = FakeEmbeddings()
+    monkeypatch.setattr(query_cache, "get_embedding_model", lambda: model)
+    monkeypatch.setattr(query_cache, "_embedding_cache", EmbeddingCache())
+    return model
+
+
+def test_lru_eviction():
+    """The least recently used entry is evicted when the cache is full."""
+    cache = QueryCache(max_size=2, ttl=None)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+    
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.evictions == 1
+
+
+def test_ttl_expiry(clock):
+    """Entries expire once older than the TTL."""
+    cache = QueryCache(ttl=300)
+    cache.put("a", 1)
+    
+    clock.now += 299
+    assert cache.get("a") == 1
+    clock.now += 2
+    assert cache.get("a") is None
+
+
+def test_contains_leaves_stats_and_order(clock):
+    """Membership checks respect the TTL without counting hits or refreshing recency."""
+    cache = QueryCache(max_size=2, ttl=300)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    
+    assert "a" in cache
+    assert "missing" not in cache
+    assert (cache.hits, cache.misses) == (0, 0)
+    
+    cache.put("c", 3)
+    assert "a" not in cache
+    
+    clock.now += 301
+    assert "b" not in cache
+
+
+def test_embed_query_cached_reuses_embedding(embeddings):
+    """Queries differing only in whitespace share one embedding call."""
+    first = embed_query_cached("BBD  revenue ")
+    second = embed_query_cached("BBD revenue")
+    
+    assert first == second
+    assert embeddings.calls == [("query", "BBD revenue")]
+
+
+def test_warm_embeddings_batches_uncached(embeddings):
+    """Warmup embeds only new, distinct queries, in one batched call."""
+    embed_query_cached("BBD revenue")
+    
+    added = warm_embeddings(["BBD revenue", "BBD litigation", "BBD  litigation", "BBD contract"])
+    
+    assert added == 2
+    assert embeddings.calls[-1] == ("documents", ["BBD litigation", "BBD contract"])
+    assert warm_embeddings(["BBD contract"]) == 0
+
+
+def test_search_cache_key():
+    """Keys ignore whitespace and filter key order but not the search parameters."""
+    key = search_cache_key("dd_legal_docs", "BBD contract", {"company_id": "BBD", "doc_type": "nda"}, 5)
+    
+    assert key == search_cache_key("dd_legal_docs", " BBD   contract", {"doc_type": "nda", "company_id": "BBD"}, 5)
+    assert key != search_cache_key("dd_legal_docs", "BBD contract", {"company_id": "BBD", "doc_type": "nda"}, 6)
+    assert key != search_cache_key("dd_hr_docs", "BBD contract", {"company_id": "BBD", "doc_type": "nda"}, 5)
+    assert key != search_cache_key("dd_legal_docs", "BBD contract", None, 5)
@@ -0,0 +1,79 @@
+"""Tests for the supervisor's semantic response cache."""
+
+import pytest
+
+from src.supervisor import response_cache
+from src.supervisor.response_cache import SemanticResponseCache
+
+
+# Fixed 3-d embeddings; "what can you do" and "what can you help with" are near-duplicates
+EMBEDDINGS = {
+    "what can you do": [1.0, 0.0, 0.0],
+    "what can you help with": [0.99, 0.1, 0.0],
+    "how do i upload files": [0.0, 1.0, 0.0],
+    "who built you": [0.0, 0.0, 1.0],
+}
+
+
+@pytest.fixture
+def embedded(monkeypatch):
+    """Replace the embedding call with the fixed table; returns the list of embedded texts."""
+    calls = []
+
+    def fake_embed(text):
+        calls.append(text)
+        return EMBEDDINGS[text]
+
+    monkeypatch.setattr(response_cache, "embed_query_cached", fake_embed)
+    return calls
+
+
+def test_similar_message_hits(embedded):
+    """A message above the similarity threshold reuses the cached response."""
+    cache = SemanticResponseCache(threshold=0.95)
+    cache.put("What can you do", "capabilities")
+    
+    assert cache.get("what can you help with") == "capabilities"
+    assert cache.hits == 1
+
+
+def test_exact_repeat_hits_without_embedding(embedded):
+    """Case and whitespace differences match exactly, without an embedding call."""
+    cache = SemanticResponseCache()
+    cache.put("what can you do", "capabilities")
+    embedded.clear()
+    
+    assert cache.get("  What  CAN you do ") == "capabilities"
+    assert embedded == []
+
+
+def test_dissimilar_message_misses(embedded):
+    """A message below the similarity threshold is a miss."""
+    cache = SemanticResponseCache(threshold=0.95)
+    cache.put("what can you do", "capabilities")
+    
+    assert cache.get("how do i upload files") is None
+    assert cache.misses == 1
+
+
+def test_lru_eviction(embedded):
+    """The least recently used response is evicted once the cache is full."""
+    cache = SemanticResponseCache(max_size=2)
+    cache.put("what can you do", "capabilities")
+    cache.put("how do i upload files", "upload")
+    cache.get("what can you do")  # refresh, leaving "upload" least recent
+    cache.put("who built you", "team")
+    
+    assert cache.get("how do i upload files") is None
+    assert cache.get("what can you do") == "capabilities"
+    assert cache.get("who built you") == "team"
+
+
+def test_exact_only_mode_never_embeds(embedded):
+    """With threshold=None only exact repeats match and nothing is embedded."""
+    cache = SemanticResponseCache(threshold=None)
+    cache.put("what can you do", "capabilities")
+    
+    assert cache.get("What can you do") == "capabilities"
+    assert cache.get("what can you help with") is None
+    assert embedded == []